@@ -16,6 +16,8 @@ from notty.src.visual.game import VisualGame
 from notty.src.visual.player import VisualPlayer
 from notty.src.visual.winner_display import WinnerDisplay
 
+logger = logging.getLogger(__name__)
+
 
 def main() -> None:
     """Start the notty game."""
@@ -26,7 +28,10 @@ def main() -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    # a larger buffer avoids audio underruns, must be set before pygame.init
+    pygame.mixer.pre_init(frequency=44100, buffer=4096)
     pygame.init()
+    # loaded before the game starts, so pygame.quit never races a music load
     start_background_music()
 
     try:
@@ -49,10 +54,14 @@ def start_background_music() -> None:
     """Start looping background music if possible."""
     music_path = get_resource_path("music.mp3", music)
 
-    pygame.mixer.init()
-    pygame.mixer.music.load(str(music_path))
-    pygame.mixer.music.set_volume(0.4)
-    pygame.mixer.music.play(-1)  # # loop forever
+    try:
+        pygame.mixer.init()
+        pygame.mixer.music.load(str(music_path))
+        pygame.mixer.music.set_volume(0.4)
+        pygame.mixer.music.play(-1)  # # loop forever
+    except pygame.error:
+        # the game is playable without music, e.g. without an audio device
+        logger.exception("Could not start background music")
 
 
 def run() -> str:
@@ -95,20 +104,49 @@ def run_event_loop(game: VisualGame) -> str:
         "new_game" if user wants to start a new game, "quit" if user wants to quit.
     """
     clock = pygame.time.Clock()
+    # only redraw when the game changed or cards are still moving
+    dirty = True
 
     while True:
-        for event in pygame.event.get():
+        if game.all_players_have_no_cards():
+            VisualGame.distribute_starting_cards(game)
+            dirty = True
+
+        # nothing to animate, so sleep until an event arrives
+        # or about one frame has passed
+        events = [] if dirty else [pygame.event.wait(16)]
+        # only fetch the events the game reacts to and drop the rest
+        events += pygame.event.get(
+            [
+                pygame.QUIT,
+                pygame.MOUSEBUTTONDOWN,
+                pygame.WINDOWEXPOSED,
+                pygame.VIDEOEXPOSE,
+            ]
+        )
+        # without pumping again, so no handled event can arrive and be dropped
+        pygame.event.clear(pump=False)
+
+        for event in events:
             if event.type == pygame.QUIT:
                 return "quit"
-            if game.all_players_have_no_cards():
-                VisualGame.distribute_starting_cards(game)
-                continue
             if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_x, mouse_y = pygame.mouse.get_pos()
+                # the click position is carried by the event itself,
+                # no need to query SDL for the mouse again
+                mouse_x, mouse_y = event.pos
                 game.action_board.handle_click(mouse_x, mouse_y)
+                dirty = True
                 continue
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # the window was uncovered or restored, repaint the board
+                dirty = True
+
+        # the computer only acts on its turn once its delay passed
+        if computer_chooses_action(game):
+            dirty = True
 
-        computer_chooses_action(game)
+        if not dirty:
+            continue
 
         game.draw()
 
@@ -123,6 +161,7 @@ def run_event_loop(game: VisualGame) -> str:
 
         # Update display
         pygame.display.flip()
+        dirty = game.is_animating()
         clock.tick(60)  # 60 FPS
 
 
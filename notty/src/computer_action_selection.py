@@ -1,5 +1,6 @@
 """Computer action selection."""
 
+import threading
 from collections import Counter
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 
 # Q-Learning agent container (persists across games)
 _qlearning_agent_container: dict[str, QLearningAgent | None] = {"agent": None}
+# Thread writing the last periodic save to disk
+_autosave_thread_container: dict[str, threading.Thread | None] = {"thread": None}
 
 
 def get_qlearning_agent() -> QLearningAgent:
@@ -199,16 +202,19 @@ def find_best_discard_group(game: "VisualGame") -> list["VisualCard"] | None:
     return discardable_groups[0]
 
 
-def computer_chooses_action(game: "VisualGame") -> None:
+def computer_chooses_action(game: "VisualGame") -> bool:
     """Computer chooses an action using Q-Learning.
 
     Args:
         game: The game instance.
+
+    Returns:
+        True if the computer took an action, False otherwise.
     """
-    # Check if current player is a computer player and auto-pass
+    # Only act on a computer turn once its delay passed
+    if not game.is_computer_turn() or not game.can_computer_act():
+        return False
     current_player = game.get_current_player()
-    if current_player.is_human or not game.can_computer_act():
-        return
     game.mark_computer_action()
 
     # Get the Q-Learning agent
@@ -256,12 +262,25 @@ def computer_chooses_action(game: "VisualGame") -> None:
 
     # Auto-save Q-table periodically (every 100 actions)
     if agent.total_actions % 100 == 0:
+        wait_for_autosave()
         save_path = str(get_qlearning_save_path())
-        agent.save(save_path)
+        _autosave_thread_container["thread"] = agent.save_in_background(save_path)
+
+    return True
+
+
+def wait_for_autosave() -> None:
+    """Wait until a pending periodic save has been written to disk."""
+    thread = _autosave_thread_container["thread"]
+    if thread is not None:
+        thread.join()
+        _autosave_thread_container["thread"] = None
 
 
 def save_qlearning_agent() -> None:
     """Save the Q-Learning agent's Q-table."""
+    # never write the same file from two threads at once
+    wait_for_autosave()
     if _qlearning_agent_container["agent"] is not None:
         save_path = str(get_qlearning_save_path())
         _qlearning_agent_container["agent"].save(save_path)
@@ -8,11 +8,15 @@ from notty.src.visual.player_name_selector import PlayerNameSelector
 
 def get_players(screen: pygame.Surface) -> list[VisualPlayer]:
     """Get the players with a selection screen to choose who you are."""
+    # Look up the available players once for both screens
+    all_names = VisualPlayer.get_all_player_names()
+
     # Show selection screen to choose yourself
-    selected_player = show_player_selection_screen(screen)
+    selected_player = show_player_selection_screen(screen, all_names)
 
     # Show opponent selection screen
-    opponent_names = show_opponent_selection_screen(screen, selected_player)
+    available_names = [name for name in all_names if name != selected_player]
+    opponent_names = show_opponent_selection_screen(screen, available_names)
 
     # Create all players
     players_list: list[VisualPlayer] = []
@@ -27,16 +31,16 @@ def get_players(screen: pygame.Surface) -> list[VisualPlayer]:
     return players_list
 
 
-def show_player_selection_screen(screen: pygame.Surface) -> str:
+def show_player_selection_screen(screen: pygame.Surface, all_names: list[str]) -> str:
     """Show a screen to select which player you want to be.
 
     Args:
         screen: The pygame display surface.
+        all_names: The names of all players to choose from.
 
     Returns:
         The name of the selected player.
     """
-    all_names = VisualPlayer.get_all_player_names()
     selector = PlayerNameSelector(
         screen=screen,
         available_names=all_names,
@@ -44,26 +48,22 @@ def show_player_selection_screen(screen: pygame.Surface) -> str:
         max_selections=1,
         min_selections=1,
     )
-    result = selector.show()
-    # Return single string (not list)
-    return result if isinstance(result, str) else result[0]
+    return selector.show_single()
 
 
 def show_opponent_selection_screen(
-    screen: pygame.Surface, human_player: str
+    screen: pygame.Surface, available_names: list[str]
 ) -> list[str]:
     """Show a screen to select 1-2 opponents.
 
     Args:
         screen: The pygame display surface.
-        human_player: The name of the human player to exclude.
+        available_names: The names of the possible opponents,
+            without the human player.
 
     Returns:
         List of selected opponent names.
     """
-    all_names = VisualPlayer.get_all_player_names()
-    available_names = [name for name in all_names if name != human_player]
-
     selector = PlayerNameSelector(
         screen=screen,
         available_names=available_names,
@@ -71,6 +71,4 @@ def show_opponent_selection_screen(
         max_selections=2,
         min_selections=1,
     )
-    result = selector.show()
-    # Return list of strings
-    return result if isinstance(result, list) else [result]
+    return selector.show_multi()
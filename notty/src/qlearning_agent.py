@@ -1,8 +1,10 @@
 """Q-Learning agent for Notty card game."""
 
+import io
 import logging
 import pickle  # nosec: B403
 import random
+import threading
 from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -159,17 +161,57 @@ class QLearningAgent:
         Args:
             filepath: Path to save the Q-table.
         """
+        self.write(filepath, self.serialize())
+
+    def save_in_background(
+        self, filepath: str = "notty_qtable.pkl"
+    ) -> threading.Thread:
+        """Save Q-table to file without blocking on the disk write.
+
+        The Q-table is serialized right away, so later learning does not
+        interfere with the snapshot that is written by the thread.
+
+        Args:
+            filepath: Path to save the Q-table.
+
+        Returns:
+            The started thread writing the file.
+        """
+        thread = threading.Thread(target=self.write, args=(filepath, self.serialize()))
+        thread.start()
+        return thread
+
+    def serialize(self) -> bytes:
+        """Serialize the Q-table and statistics in memory.
+
+        Returns:
+            The pickled data.
+        """
         data: dict[
             str, dict[tuple[int, int, bool, int], dict[str, float]] | float | int
         ] = {
-            "q_table": dict(self.q_table),
+            # plain dicts keep the file compact and fast to unpickle
+            "q_table": {
+                state: dict(actions) for state, actions in self.q_table.items()
+            },
             "epsilon": self.epsilon,
             "total_actions": self.total_actions,
             "exploration_actions": self.exploration_actions,
         }
+        buffer = io.BytesIO()
+        pickle.dump(data, buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def write(filepath: str, data: bytes) -> None:
+        """Write serialized data to file in a single write.
+
+        Args:
+            filepath: Path to save the Q-table.
+            data: The serialized Q-table.
+        """
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with Path(filepath).open("wb") as f:
-            pickle.dump(data, f)
+        Path(filepath).write_bytes(data)
         logger.info("Q-table saved to %s", filepath)
 
     def load(self, filepath: str = "notty_qtable.pkl") -> bool:
@@ -190,10 +232,13 @@ class QLearningAgent:
                 data = pickle.load(f)  # nosec: B301  # noqa: S301
 
             # Convert back to defaultdict
-            self.q_table = defaultdict(lambda: defaultdict(float))
-            for state, actions in data["q_table"].items():
-                for action, q_value in actions.items():
-                    self.q_table[state][action] = q_value
+            self.q_table = defaultdict(
+                lambda: defaultdict(float),
+                {
+                    state: defaultdict(float, actions)
+                    for state, actions in data["q_table"].items()
+                },
+            )
 
             self.epsilon = data.get("epsilon", self.epsilon)
             self.total_actions = data.get("total_actions", 0)
@@ -1,5 +1,6 @@
 """utils."""
 
+from functools import cache, lru_cache
 from pathlib import Path
 
 import pygame
@@ -56,3 +57,111 @@ def get_qlearning_save_path() -> Path:
         Path to the Q-table save file.
     """
     return get_user_data_dir() / "notty_qtable.pkl"
+
+
+@cache
+def get_font(size: int) -> pygame.font.Font:
+    """Get the default font in the given size.
+
+    Fonts are cached, so the font file is only loaded once per size.
+
+    Args:
+        size: The font size in pixels.
+
+    Returns:
+        The font.
+    """
+    return pygame.font.Font(None, size)
+
+
+@lru_cache(maxsize=256)
+def render_text(
+    text: str, size: int, color: tuple[int, int, int], *, antialias: bool
+) -> pygame.Surface:
+    """Render text with the default font.
+
+    Rendered texts are cached, so static labels are only rasterized once.
+    The returned surface is shared and must not be modified.
+
+    Args:
+        text: The text to render.
+        size: The font size in pixels.
+        color: The text color.
+        antialias: Whether to smooth the edges of the text.
+
+    Returns:
+        The rendered text.
+    """
+    return get_font(size).render(text, antialias, color)
+
+
+@lru_cache(maxsize=16)
+def render_border(
+    width: int, height: int, color: tuple[int, int, int], border_width: int
+) -> pygame.Surface:
+    """Render a rectangle outline on a transparent surface.
+
+    Rendered borders are cached, so buttons of the same size share them.
+    The returned surface is shared and must not be modified.
+
+    Args:
+        width: The outer width of the border.
+        height: The outer height of the border.
+        color: The border color.
+        border_width: The thickness of the border.
+
+    Returns:
+        The rendered border.
+    """
+    border = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(border, color, border.get_rect(), border_width)
+    return border.convert_alpha()
+
+
+@lru_cache(maxsize=256)
+def load_scaled_image(
+    path: Path, width: int, height: int, *, smooth: bool = False, opaque: bool = False
+) -> pygame.Surface:
+    """Load an image and scale it to the given size.
+
+    Scaled images are cached, so every asset is only read and scaled once
+    per size. The returned surface is shared and must not be modified.
+    The image is converted to the display format, so a display mode
+    must be set before calling this.
+
+    Args:
+        path: The path of the image file.
+        width: The width to scale the image to.
+        height: The height to scale the image to.
+        smooth: Whether to filter the image while scaling instead of picking
+            the nearest pixels, looks better for large downscales.
+        opaque: Whether the image has no transparent pixels, so the alpha
+            channel can be dropped for faster blits.
+
+    Returns:
+        The scaled image.
+    """
+    # match the display format once instead of converting on every blit
+    image = pygame.image.load(path)
+    image = image.convert() if opaque else image.convert_alpha()
+    if smooth:
+        return pygame.transform.smoothscale(image, (width, height))
+    return pygame.transform.scale(image, (width, height))
+
+
+def wait_for_events(event_types: list[int]) -> list[pygame.event.Event]:
+    """Wait for the next events, at most about one frame.
+
+    Blocks until something happens instead of spinning on an idle dialog.
+    All other events are dropped, hover is read from the mouse state.
+
+    Args:
+        event_types: The event types handled by the caller.
+
+    Returns:
+        The events of the given types, may include a NOEVENT on timeout.
+    """
+    events = [pygame.event.wait(16), *pygame.event.get(event_types)]
+    # without pumping again, so no handled event can arrive and be dropped
+    pygame.event.clear(pump=False)
+    return events
@@ -1,6 +1,6 @@
 """Action board for displaying available actions to the human player."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import pygame
 
@@ -11,6 +11,7 @@ from notty.src.consts import (
     ACTION_BOARD_Y,
     ANTI_ALIASING,
 )
+from notty.src.utils import render_text
 
 if TYPE_CHECKING:
     from notty.src.visual.game import VisualGame
@@ -27,17 +28,62 @@ class Action:
     NEXT_TURN = "next_turn"
     PLAY_FOR_ME = "play_for_me"
 
+    ALL_ACTIONS: ClassVar[frozenset[str]] = frozenset(
+        {
+            DRAW_MULTIPLE,
+            STEAL,
+            DRAW_DISCARD_DRAW,
+            DRAW_DISCARD_DISCARD,
+            DISCARD_GROUP,
+            NEXT_TURN,
+        }
+    )
+
     @classmethod
-    def get_all_actions(cls) -> set[str]:
+    def get_all_actions(cls) -> frozenset[str]:
         """Get all actions."""
-        return {
-            cls.DRAW_MULTIPLE,
-            cls.STEAL,
-            cls.DRAW_DISCARD_DRAW,
-            cls.DRAW_DISCARD_DISCARD,
-            cls.DISCARD_GROUP,
-            cls.NEXT_TURN,
-        }
+        return cls.ALL_ACTIONS
+
+
+# The action board never moves or resizes, so the button layout
+# is computed once at import time
+ACTION_BUTTON_LABELS: tuple[tuple[str, str], ...] = (
+    ("Draw 1-3 Cards", Action.DRAW_MULTIPLE),
+    ("Steal Card", Action.STEAL),
+    ("Draw & Discard (Draw)", Action.DRAW_DISCARD_DRAW),
+    ("Draw & Discard (Discard)", Action.DRAW_DISCARD_DISCARD),
+    ("Discard Group", Action.DISCARD_GROUP),
+    ("Next Turn", Action.NEXT_TURN),
+    ("Play for Me", Action.PLAY_FOR_ME),
+)
+ACTION_BUTTON_SPACING = 10  # above, below, and between buttons
+ACTION_BUTTON_PADDING = 15  # on both sides of the buttons
+# Button width is board width minus padding on both sides
+ACTION_BUTTON_WIDTH = ACTION_BOARD_WIDTH - 2 * ACTION_BUTTON_PADDING
+# Button height is calculated to fit all buttons with spacing
+ACTION_BUTTON_HEIGHT = (
+    ACTION_BOARD_HEIGHT - ACTION_BUTTON_SPACING * (len(ACTION_BUTTON_LABELS) + 1)
+) // len(ACTION_BUTTON_LABELS)
+ACTION_BUTTON_RECTS: tuple[tuple[int, int, int, int], ...] = tuple(
+    (
+        ACTION_BOARD_X + ACTION_BUTTON_PADDING,
+        ACTION_BOARD_Y
+        + ACTION_BUTTON_SPACING
+        + i * (ACTION_BUTTON_HEIGHT + ACTION_BUTTON_SPACING),
+        ACTION_BUTTON_WIDTH,
+        ACTION_BUTTON_HEIGHT,
+    )
+    for i in range(len(ACTION_BUTTON_LABELS))
+)
+ACTION_PANEL_PADDING = 15
+ACTION_PANEL_RECT = (
+    ACTION_BOARD_X + ACTION_BUTTON_PADDING - ACTION_PANEL_PADDING,
+    ACTION_BOARD_Y + ACTION_BUTTON_SPACING - ACTION_PANEL_PADDING,
+    ACTION_BUTTON_WIDTH + 2 * ACTION_PANEL_PADDING,
+    len(ACTION_BUTTON_LABELS) * (ACTION_BUTTON_HEIGHT + ACTION_BUTTON_SPACING)
+    - ACTION_BUTTON_SPACING
+    + 2 * ACTION_PANEL_PADDING,
+)
 
 
 class ActionButton:
@@ -69,11 +115,33 @@ class ActionButton:
         self.y = y
         self.width = width
         self.height = height
+        # hit box for hover and click checks
+        self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.action_name = action_name
         self.enabled = enabled
         self.hovered = False
 
+        # The look of each state never changes, so render them once
+        self.disabled_surface = self._build_state_surface(
+            bg_color=(100, 100, 100),  # Gray for disabled
+            text_color=(150, 150, 150),  # Light gray text
+            border_color=(80, 80, 80),
+            alpha=100,  # Faded out
+        )
+        self.hovered_surface = self._build_state_surface(
+            bg_color=(100, 200, 255),  # Light blue for hover
+            text_color=(0, 0, 0),  # Black text
+            border_color=(50, 150, 255),
+            alpha=255,  # Fully visible
+        )
+        self.normal_surface = self._build_state_surface(
+            bg_color=(50, 150, 50),  # Green for enabled
+            text_color=(255, 255, 255),  # White text
+            border_color=(30, 100, 30),
+            alpha=255,  # Fully visible
+        )
+
     def is_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """Check if the button was clicked.
 
@@ -84,12 +152,7 @@ class ActionButton:
         Returns:
             True if the button was clicked and is enabled.
         """
-        if not self.enabled:
-            return False
-        return (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        return self.enabled and bool(self.rect.collidepoint(mouse_x, mouse_y))
 
     def update_hover(self, mouse_x: int, mouse_y: int) -> None:
         """Update hover state based on mouse position.
@@ -98,34 +161,26 @@ class ActionButton:
             mouse_x: Mouse x coordinate.
             mouse_y: Mouse y coordinate.
         """
-        self.hovered = (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        self.hovered = bool(self.rect.collidepoint(mouse_x, mouse_y))
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the button.
+    def _build_state_surface(
+        self,
+        bg_color: tuple[int, int, int],
+        text_color: tuple[int, int, int],
+        border_color: tuple[int, int, int],
+        alpha: int,
+    ) -> pygame.Surface:
+        """Render the button in one visual state.
 
         Args:
-            screen: The pygame display surface.
-        """
-        # Determine button color based on state
-        if not self.enabled:
-            bg_color = (100, 100, 100)  # Gray for disabled
-            text_color = (150, 150, 150)  # Light gray text
-            border_color = (80, 80, 80)
-            alpha = 100  # Faded out
-        elif self.hovered:
-            bg_color = (100, 200, 255)  # Light blue for hover
-            text_color = (0, 0, 0)  # Black text
-            border_color = (50, 150, 255)
-            alpha = 255  # Fully visible
-        else:
-            bg_color = (50, 150, 50)  # Green for enabled
-            text_color = (255, 255, 255)  # White text
-            border_color = (30, 100, 30)
-            alpha = 255  # Fully visible
+            bg_color: Background color of the button.
+            text_color: Color of the button text.
+            border_color: Color of the button border.
+            alpha: Transparency of the whole button.
 
+        Returns:
+            The rendered button.
+        """
         # Create a surface for the button with alpha channel
         button_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
 
@@ -139,14 +194,40 @@ class ActionButton:
 
         # Draw button text on the surface - scale font size based on button height
         font_size = int(self.height * 0.5)  # 70% of button height (doubled from 35%)
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(self.text, ANTI_ALIASING, text_color)
+        text_surface = render_text(
+            self.text, font_size, text_color, antialias=ANTI_ALIASING
+        )
         text_rect = text_surface.get_rect(center=(self.width // 2, self.height // 2))
         button_surface.blit(text_surface, text_rect)
 
-        # Set alpha and blit to screen
-        button_surface.set_alpha(alpha)
-        screen.blit(button_surface, (self.x, self.y))
+        # Bake the transparency into the pixels instead of a surface alpha
+        button_surface.fill(
+            (255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT
+        )
+        return button_surface.convert_alpha()
+
+    def get_blit_pair(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Get the surface for the current state and where to blit it.
+
+        Returns:
+            Tuple of (surface, position) as expected by Surface.blits.
+        """
+        # Pick the pre-rendered surface for the current state
+        if not self.enabled:
+            button_surface = self.disabled_surface
+        elif self.hovered:
+            button_surface = self.hovered_surface
+        else:
+            button_surface = self.normal_surface
+        return button_surface, (self.x, self.y)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw the button.
+
+        Args:
+            screen: The pygame display surface.
+        """
+        screen.blit(*self.get_blit_pair())
 
 
 class ActionBoard:
@@ -173,52 +254,44 @@ class ActionBoard:
 
     def _setup_buttons(self) -> None:
         """Set up the action buttons."""
-        # Use constants from consts.py for action board position and size
-        board_x = ACTION_BOARD_X
-        board_y = ACTION_BOARD_Y
-        board_width = ACTION_BOARD_WIDTH
-        board_height = ACTION_BOARD_HEIGHT
-
-        # Define all possible actions
-        actions = [
-            ("Draw 1-3 Cards", Action.DRAW_MULTIPLE),
-            ("Steal Card", Action.STEAL),
-            ("Draw & Discard (Draw)", Action.DRAW_DISCARD_DRAW),
-            ("Draw & Discard (Discard)", Action.DRAW_DISCARD_DISCARD),
-            ("Discard Group", Action.DISCARD_GROUP),
-            ("Next Turn", Action.NEXT_TURN),
-            ("Play for Me", Action.PLAY_FOR_ME),
-        ]
-
-        # Calculate button dimensions based on action board size and number of buttons
-        num_buttons = len(actions)
-        button_spacing = 10
-        total_spacing = button_spacing * (
-            num_buttons + 1
-        )  # Spacing above, below, and between buttons
-
-        # Button width is board width minus padding on both sides
-        button_padding = 15
-        button_width = board_width - (2 * button_padding)
-
-        # Button height is calculated to fit all buttons with spacing
-        button_height = (board_height - total_spacing) // num_buttons
-
-        # Create buttons
-        for i, (text, action_name) in enumerate(actions):
-            y = board_y + button_spacing + i * (button_height + button_spacing)
-            x = board_x + button_padding
+        # Create buttons from the precomputed layout
+        for (x, y, width, height), (text, action_name) in zip(
+            ACTION_BUTTON_RECTS, ACTION_BUTTON_LABELS, strict=True
+        ):
             button = ActionButton(
                 x=x,
                 y=y,
-                width=button_width,
-                height=button_height,
+                width=width,
+                height=height,
                 text=text,
                 action_name=action_name,
                 enabled=False,  # Will be updated based on game state
             )
             self.buttons.append(button)
 
+        # The panel around the buttons never moves, so build it once
+        self.panel_rect = pygame.Rect(ACTION_PANEL_RECT)
+        # semi-transparent background with the border baked in
+        self.panel_surface = pygame.Surface(
+            self.panel_rect.size, pygame.SRCALPHA
+        ).convert_alpha()
+        self.panel_surface.fill((40, 40, 40, 200))
+        pygame.draw.rect(
+            self.panel_surface, (200, 200, 200), self.panel_surface.get_rect(), 3
+        )
+
+        # Title - scale font size
+        font_size = int(ACTION_BOARD_HEIGHT * 0.04)  # 4% of action board height
+        self.title_surface = render_text(
+            "Actions", font_size, (255, 255, 255), antialias=ANTI_ALIASING
+        )
+        self.title_rect = self.title_surface.get_rect(
+            center=(
+                self.panel_rect.centerx,
+                self.panel_rect.y - int(ACTION_BOARD_HEIGHT * 0.025),
+            )
+        )
+
     def update_button_states(self, game: "VisualGame") -> None:
         """Update button enabled states based on current game state.
 
@@ -227,6 +300,8 @@ class ActionBoard:
         """
         current_player = game.get_current_player()
         is_human_turn = current_player.is_human
+        # ask the game once instead of checking every action separately
+        possible_actions = game.get_possible_actions() if is_human_turn else frozenset()
 
         for button in self.buttons:
             if not is_human_turn:
@@ -235,7 +310,7 @@ class ActionBoard:
                 # "Play for Me" button is always enabled during human's turn
                 button.enabled = True
             else:
-                button.enabled = game.action_is_possible(button.action_name)
+                button.enabled = button.action_name in possible_actions
 
     def update_hover(self, mouse_x: int, mouse_y: int) -> None:
         """Update hover state for all buttons.
@@ -268,50 +343,21 @@ class ActionBoard:
     def draw(self) -> None:
         """Draw the action board and all buttons.
 
-        Automatically updates button states before drawing.
+        The button states are updated by the game whenever its state changes.
         """
-        # Automatically update button states based on current game state
-        self.update_button_states(self.game)
-
-        # Draw background panel
-        panel_padding = 15
-        if self.buttons:
-            first_button = self.buttons[0]
-            last_button = self.buttons[-1]
-
-            panel_x = first_button.x - panel_padding
-            panel_y = first_button.y - panel_padding
-            panel_width = first_button.width + 2 * panel_padding
-            panel_height = (
-                last_button.y + last_button.height - first_button.y + 2 * panel_padding
-            )
-
-            # Draw semi-transparent background
-            panel_surface = pygame.Surface((panel_width, panel_height))
-            panel_surface.set_alpha(200)
-            panel_surface.fill((40, 40, 40))
-            self.screen.blit(panel_surface, (panel_x, panel_y))
-
-            # Draw border
-            pygame.draw.rect(
-                self.screen,
-                (200, 200, 200),
-                (panel_x, panel_y, panel_width, panel_height),
-                3,
-            )
-
-            # Draw title - scale font size
-            font_size = int(ACTION_BOARD_HEIGHT * 0.04)  # 4% of action board height
-            font = pygame.font.Font(None, font_size)
-            title_text = font.render("Actions", ANTI_ALIASING, (255, 255, 255))
-            title_rect = title_text.get_rect(
-                center=(
-                    panel_x + panel_width // 2,
-                    panel_y - int(ACTION_BOARD_HEIGHT * 0.025),
-                )
-            )
-            self.screen.blit(title_text, title_rect)
-
-        # Draw all buttons
-        for button in self.buttons:
-            button.draw(self.screen)
+        # Draw semi-transparent background and border
+        self.screen.blit(self.panel_surface, self.panel_rect)
+
+        # Draw title
+        self.screen.blit(self.title_surface, self.title_rect)
+
+        # Draw all buttons inside the clipping area with a single call
+        clip = self.screen.get_clip()
+        self.screen.blits(
+            [
+                button.get_blit_pair()
+                for button in self.buttons
+                if button.rect.colliderect(clip)
+            ],
+            doreturn=False,
+        )
@@ -8,6 +8,7 @@ import pygame
 from pyrig.dev.artifacts.resources.resource import get_resource_path
 
 from notty.src.consts import ANIMATION_SPEED
+from notty.src.utils import load_scaled_image
 
 
 class Visual(ABC):
@@ -30,16 +31,33 @@ class Visual(ABC):
             width: Width of the visual element.
             screen: The pygame display surface.
         """
-        self.x = x
-        self.y = y
-        self.target_x = x
-        self.target_y = y
+        self.position = pygame.math.Vector2(x, y)
+        self.target = pygame.math.Vector2(x, y)
+        # whether the element still has to move toward its target
+        self.moving = False
         self.height = height
         self.width = width
         self.screen = screen
 
-        png = pygame.image.load(self.get_png_path())
-        self.png = pygame.transform.scale(png, (self.width, self.height))
+        self.png = self.load_png()
+
+    @property
+    def x(self) -> int:
+        """Get the current x coordinate of the visual element."""
+        return int(self.position.x)
+
+    @property
+    def y(self) -> int:
+        """Get the current y coordinate of the visual element."""
+        return int(self.position.y)
+
+    def load_png(self) -> pygame.Surface:
+        """Load the png for the visual element, scaled to its size.
+
+        Returns:
+            The scaled png.
+        """
+        return load_scaled_image(self.get_png_path(), self.width, self.height)
 
     def get_center(self) -> tuple[int, int]:
         """Get the center of the visual element."""
@@ -54,8 +72,8 @@ class Visual(ABC):
             x: X coordinate.
             y: Y coordinate.
         """
-        self.target_x = x
-        self.target_y = y
+        self.target.update(x, y)
+        self.moving = self.position != self.target
 
     def set_position(self, x: int, y: int) -> None:
         """Set the position of the visual element.
@@ -64,31 +82,58 @@ class Visual(ABC):
             x: X coordinate.
             y: Y coordinate.
         """
-        self.x = x
-        self.y = y
+        self.position.update(x, y)
+        self.moving = self.position != self.target
+
+    def is_moving(self) -> bool:
+        """Check if the visual element is still moving toward its target.
+
+        Returns:
+            True if the element has not reached its target yet.
+        """
+        return self.moving
+
+    def animate(self) -> None:
+        """Move the visual element one step toward its target.
+
+        Moves at constant speed and snaps to the target when close enough.
+        Elements that reached their target are skipped.
+        """
+        if not self.moving:
+            return
+        self.position.move_towards_ip(self.target, ANIMATION_SPEED)
+        self.moving = self.position != self.target
+
+    def get_visuals(self) -> list["Visual"]:
+        """Get the visual elements to draw for this element, bottom to top.
+
+        Returns:
+            The visual elements in drawing order.
+        """
+        return [self]
+
+    def get_blit_pairs(
+        self,
+    ) -> list[tuple[pygame.Surface, pygame.Vector2 | tuple[int, int]]]:
+        """Get the surfaces of this element and where to blit them, bottom to top.
+
+        Returns:
+            List of (surface, position) as expected by Surface.blits.
+        """
+        return [(self.png, self.position)]
 
     def draw(self) -> None:
-        """Draw the visual element.
+        """Draw the visual element and everything it contains.
 
-        Args:
-            screen: The pygame display surface.
+        All elements are animated first and then drawn with a single blits call.
         """
-        # Smoothly move toward target
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        distance = (dx**2 + dy**2) ** 0.5
-
-        if distance > ANIMATION_SPEED:
-            # Move toward target at constant speed
-            self.x += (dx / distance) * ANIMATION_SPEED
-            self.y += (dy / distance) * ANIMATION_SPEED
-        else:
-            # Snap to target when close enough
-            self.x = self.target_x
-            self.y = self.target_y
-
-        # Draw the image at current position
-        self.screen.blit(self.png, (self.x, self.y))
+        visuals = self.get_visuals()
+        for visual in visuals:
+            visual.animate()
+        self.screen.blits(
+            [pair for visual in visuals for pair in visual.get_blit_pairs()],
+            doreturn=False,
+        )
 
     def get_png_path(self) -> Path:
         """Get the png for the visual element."""
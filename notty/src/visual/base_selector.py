@@ -7,6 +7,7 @@ from typing import TypeVar
 import pygame
 
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
+from notty.src.utils import render_text, wait_for_events
 
 T = TypeVar("T")
 
@@ -42,12 +43,17 @@ class SelectableButton[T](ABC):
         self.y = y
         self.width = width
         self.height = height
+        # hit box for hover and click checks
+        self.rect = pygame.Rect(x, y, width, height)
         self.item = item
         self.image = image
         self.enabled = enabled
         self.selectable = selectable
         self.hovered = False
         self.selected = False
+        # pre-composed (surface, position) of the idle state, if the button
+        # supports it, so idle buttons can be drawn in one batch
+        self.idle_layer: tuple[pygame.Surface, tuple[int, int]] | None = None
 
     def is_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """Check if the button was clicked.
@@ -59,12 +65,7 @@ class SelectableButton[T](ABC):
         Returns:
             True if the button was clicked and is enabled.
         """
-        if not self.enabled:
-            return False
-        return (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        return self.enabled and bool(self.rect.collidepoint(mouse_x, mouse_y))
 
     def update_hover(self, mouse_x: int, mouse_y: int) -> None:
         """Update hover state based on mouse position.
@@ -76,27 +77,28 @@ class SelectableButton[T](ABC):
         if not self.enabled:
             self.hovered = False
             return
-        self.hovered = (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        self.hovered = bool(self.rect.collidepoint(mouse_x, mouse_y))
 
-    def toggle_selection(
-        self, current_selected_count: int, max_selections: int
-    ) -> None:
+    def toggle_selection(self, current_selected_count: int, max_selections: int) -> int:
         """Toggle the selection state of this button.
 
         Args:
             current_selected_count: Number of currently selected items.
             max_selections: Maximum number of selections allowed.
+
+        Returns:
+            The change of the number of selected items (-1, 0 or 1).
         """
         if self.selectable:
             if self.selected:
                 # Always allow deselection
                 self.selected = False
-            elif current_selected_count < max_selections:
+                return -1
+            if current_selected_count < max_selections:
                 # Only allow selection if under max
                 self.selected = True
+                return 1
+        return 0
 
     @abstractmethod
     def draw(self, screen: pygame.Surface) -> None:
@@ -135,7 +137,15 @@ class BaseSelector[T](ABC):
         self.max_selections = max_selections
         self.validation_func = validation_func
         self.buttons: list[SelectableButton[T]] = []
+        # kept up to date on every toggle instead of counting the buttons
+        self.selected_count = 0
         self._setup_buttons()
+        # hit boxes in button order, so clicks are resolved with one C call
+        self.button_rects = [button.rect for button in self.buttons]
+        # index of the hovered button, -1 if none
+        self.hovered_index = -1
+        self.chrome_surface = self._build_chrome()
+        self.title_surface, self.title_rect = self._render_title()
 
     @abstractmethod
     def _setup_buttons(self) -> None:
@@ -157,6 +167,17 @@ class BaseSelector[T](ABC):
             Tuple of (dialog_width, dialog_height).
         """
 
+    def _get_dialog_rect(self) -> pygame.Rect:
+        """Get the rectangle of the dialog, centered on the screen.
+
+        Returns:
+            The dialog rectangle.
+        """
+        dialog_width, dialog_height = self._get_dialog_dimensions()
+        dialog_x = int((APP_WIDTH - dialog_width) // 2)
+        dialog_y = int((APP_HEIGHT - dialog_height) // 2)
+        return pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
+
     def _get_selected_items(self) -> list[T]:
         """Get the list of currently selected items.
 
@@ -165,18 +186,27 @@ class BaseSelector[T](ABC):
         """
         return [button.item for button in self.buttons if button.selected]
 
+    def _toggle_selection(self, button: SelectableButton[T]) -> None:
+        """Toggle the selection of a button and update the selected count.
+
+        Args:
+            button: The button to toggle.
+        """
+        self.selected_count += button.toggle_selection(
+            self.selected_count, self.max_selections
+        )
+
     def _is_valid_selection(self) -> bool:
         """Check if the current selection is valid.
 
         Returns:
             True if the selection is valid.
         """
-        selected = self._get_selected_items()
-        if not selected:
+        if not self.selected_count:
             return False
         if self.validation_func:
-            return self.validation_func(selected)
-        return len(selected) <= self.max_selections
+            return self.validation_func(self._get_selected_items())
+        return self.selected_count <= self.max_selections
 
     def show(self) -> list[T] | T | None:
         """Show the selector and wait for user input.
@@ -188,75 +218,169 @@ class BaseSelector[T](ABC):
         """
         clock = pygame.time.Clock()
 
+        # Keep what is behind the dialog so it can be redrawn on top of it
+        background = self.screen.copy()
+        dialog_rect = self._get_dialog_rect()
+
+        # Initial paint of the whole screen
+        self._draw()
+        pygame.display.flip()
+
         while True:
+            needs_redraw = False
+
+            events = wait_for_events([pygame.QUIT, pygame.MOUSEBUTTONDOWN])
+
             # Handle events
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     raise SystemExit
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-
-                    # Check if any button was clicked
-                    for button in self.buttons:
-                        if button.is_clicked(mouse_x, mouse_y):
-                            if self.max_selections == 1:
-                                # Single selection - return immediately
-                                return button.item
-                            # Multi-selection - toggle selection
-                            current_count = len(self._get_selected_items())
-                            button.toggle_selection(current_count, self.max_selections)
-                            break
+                    # Check if any button was clicked where the click happened
+                    button = self._get_clicked_button(*event.pos)
+                    if button is not None:
+                        if self.max_selections == 1:
+                            # Single selection - return immediately
+                            return button.item
+                        # Multi-selection - toggle selection
+                        self._toggle_selection(button)
+                        needs_redraw = True
 
             # Update hover state
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            for button in self.buttons:
-                button.update_hover(mouse_x, mouse_y)
+            if self._update_hover(*pygame.mouse.get_pos()):
+                needs_redraw = True
 
-            # Draw
-            self._draw()
+            # Only redraw when something changed and only update the dialog area
+            if needs_redraw:
+                self.screen.blit(background, (0, 0))
+                self._draw()
+                pygame.display.update(dialog_rect)
 
-            # Update display
-            pygame.display.flip()
             clock.tick(60)  # 60 FPS
 
-    def _draw(self) -> None:
-        """Draw the selector dialog."""
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((int(APP_WIDTH), int(APP_HEIGHT)))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+    def _get_clicked_button(
+        self, mouse_x: int, mouse_y: int
+    ) -> SelectableButton[T] | None:
+        """Get the button that was clicked.
 
-        # Get dialog dimensions
-        dialog_width, dialog_height = self._get_dialog_dimensions()
-        dialog_x = int((APP_WIDTH - dialog_width) // 2)
-        dialog_y = int((APP_HEIGHT - dialog_height) // 2)
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
 
-        # Draw dialog background
-        pygame.draw.rect(
-            self.screen,
-            (40, 40, 40),
-            (dialog_x, dialog_y, dialog_width, dialog_height),
-        )
+        Returns:
+            The clicked button, or None if no enabled button is under the mouse.
+        """
+        index = self._get_button_index(mouse_x, mouse_y)
+        if index == -1:
+            return None
+        button = self.buttons[index]
+        return button if button.enabled else None
 
-        # Draw dialog border
-        pygame.draw.rect(
-            self.screen,
-            (200, 200, 200),
-            (dialog_x, dialog_y, dialog_width, dialog_height),
-            3,
-        )
+    def _get_button_index(self, mouse_x: int, mouse_y: int) -> int:
+        """Get the index of the button under the mouse.
 
-        # Draw title
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
+
+        Returns:
+            The index of the button, or -1 if there is none.
+        """
+        return pygame.Rect(mouse_x, mouse_y, 1, 1).collidelist(self.button_rects)
+
+    def _update_hover(self, mouse_x: int, mouse_y: int) -> bool:
+        """Update the hover state of the buttons.
+
+        Only the buttons the mouse left or entered are updated.
+
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
+
+        Returns:
+            True if the hover state of any button changed.
+        """
+        index = self._get_button_index(mouse_x, mouse_y)
+        if index == self.hovered_index:
+            return False
+        changed = False
+        for i in (self.hovered_index, index):
+            if i != -1:
+                button = self.buttons[i]
+                was_hovered = button.hovered
+                button.update_hover(mouse_x, mouse_y)
+                changed = changed or button.hovered != was_hovered
+        self.hovered_index = index
+        return changed
+
+    def _render_title(self) -> tuple[pygame.Surface, pygame.Rect]:
+        """Render the title, which never changes.
+
+        Returns:
+            Tuple of (title_surface, title_rect).
+        """
         font_size = int(APP_HEIGHT * 0.06)  # 6% of screen height
-        font = pygame.font.Font(None, font_size)
-        title_text = font.render(self.title, ANTI_ALIASING, (255, 255, 255))
-        title_rect = title_text.get_rect(
-            center=(int(APP_WIDTH // 2), dialog_y + int(APP_HEIGHT * 0.06))
+        title_surface = render_text(
+            self.title, font_size, (255, 255, 255), antialias=ANTI_ALIASING
+        )
+        title_rect = title_surface.get_rect(
+            center=(
+                int(APP_WIDTH // 2),
+                self._get_dialog_rect().y + int(APP_HEIGHT * 0.06),
+            )
         )
-        self.screen.blit(title_text, title_rect)
+        return title_surface, title_rect
+
+    def _build_chrome(self) -> pygame.Surface | None:
+        """Render the overlay and dialog box, which never change.
+
+        Returns:
+            A screen-sized surface with the overlay and dialog box,
+                or None if the subclass draws its own background.
+        """
+        # Semi-transparent overlay
+        chrome = pygame.Surface((int(APP_WIDTH), int(APP_HEIGHT)), pygame.SRCALPHA)
+        chrome.fill((0, 0, 0, 200))
+
+        # Get dialog dimensions
+        dialog_rect = self._get_dialog_rect()
+
+        # Dialog background
+        pygame.draw.rect(chrome, (40, 40, 40), dialog_rect)
+
+        # Dialog border
+        pygame.draw.rect(chrome, (200, 200, 200), dialog_rect, 3)
+        return chrome
+
+    def _draw(self) -> None:
+        """Draw the selector dialog."""
+        # Draw overlay and dialog in one go
+        if self.chrome_surface is not None:
+            self.screen.blit(self.chrome_surface, (0, 0))
+
+        # Draw title, separately since it can overhang the dialog
+        self.screen.blit(self.title_surface, self.title_rect)
 
         # Draw buttons
+        self._draw_buttons()
+
+    def _draw_buttons(self) -> None:
+        """Draw the buttons, skipping the ones outside of the clipping area.
+
+        Idle buttons with a pre-composed layer are drawn with a single blits
+        call, only hovered or selected ones are drawn one by one.
+        """
+        clip = self.screen.get_clip()
+        idle_layers: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        active_buttons: list[SelectableButton[T]] = []
         for button in self.buttons:
+            if not button.rect.colliderect(clip):
+                continue
+            if button.idle_layer and not button.hovered and not button.selected:
+                idle_layers.append(button.idle_layer)
+            else:
+                active_buttons.append(button)
+        self.screen.blits(idle_layers, doreturn=False)
+        for button in active_buttons:
             button.draw(self.screen)
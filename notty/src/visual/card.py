@@ -7,6 +7,7 @@ import pygame
 
 from notty.dev.artifacts.resources.visuals import cards
 from notty.src.consts import CARD_HEIGHT, CARD_WIDTH
+from notty.src.utils import load_scaled_image
 from notty.src.visual.base import Visual
 
 
@@ -70,6 +71,19 @@ class VisualCard(Visual):
         self.number = number
         super().__init__(x, y, CARD_HEIGHT, CARD_WIDTH, screen)
 
+    def load_png(self) -> pygame.Surface:
+        """Load the png for the card.
+
+        Card faces are opaque, so they are loaded without an alpha channel.
+        Identical cards share the face cached by load_scaled_image.
+
+        Returns:
+            The scaled png.
+        """
+        return load_scaled_image(
+            self.get_png_path(), self.width, self.height, opaque=True
+        )
+
     def get_png_name(self) -> str:
         """Get the png for the visual element."""
         return f"{self.number}"
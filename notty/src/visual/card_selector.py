@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 import pygame
 
 from notty.src.consts import APP_HEIGHT, APP_WIDTH
+from notty.src.utils import load_scaled_image
 from notty.src.visual.base_selector import BaseSelector, SelectableButton
 
 if TYPE_CHECKING:
@@ -135,7 +136,7 @@ class CardSelector(BaseSelector["VisualCard"]):
             x = start_x + col * (card_width + card_spacing)
             y = start_y + row * (card_height + card_spacing)
 
-            # Scale card image
-            card_image = pygame.transform.scale(card.png, (card_width, card_height))
+            # Scaled card image in display format, shared by identical cards
+            card_image = load_scaled_image(card.get_png_path(), card_width, card_height)
             button = CardButton(x, y, card_width, card_height, card, card_image)
             self.buttons.append(button)
@@ -6,6 +6,12 @@ from typing import TYPE_CHECKING
 import pygame
 
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
+from notty.src.utils import (
+    load_scaled_image,
+    render_border,
+    render_text,
+    wait_for_events,
+)
 from notty.src.visual.base_selector import BaseSelector, SelectableButton
 
 if TYPE_CHECKING:
@@ -39,56 +45,71 @@ class MultiCardButton(SelectableButton["VisualCard"]):
         )
         self.card = card
         self.card_image = card_image
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the button.
+        # every state looks the same each frame, so compose each one once
+        self.state_layers = {
+            # White, light blue and green borders
+            "idle": self._build_state_layer((255, 255, 255), 3),
+            "hovered": self._build_state_layer((100, 200, 255), 5),
+            "selected": self._build_state_layer((50, 255, 50), 6, selected=True),
+        }
+        self.idle_layer = self.state_layers["idle"]
+
+    def _build_state_layer(
+        self,
+        border_color: tuple[int, int, int],
+        border_width: int,
+        *,
+        selected: bool = False,
+    ) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Compose the border, card image and selection mark of one state.
 
         Args:
-            screen: The pygame display surface.
-        """
-        # Determine border color based on state
-        if self.selected:
-            border_color = (50, 255, 50)  # Green for selected
-            border_width = 6
-        elif self.hovered:
-            border_color = (100, 200, 255)  # Light blue for hover
-            border_width = 5
-        else:
-            border_color = (255, 255, 255)  # White
-            border_width = 3
+            border_color: Color of the border.
+            border_width: Thickness of the border.
+            selected: Whether to add the overlay and checkmark of a selected card.
 
-        # Draw border
+        Returns:
+            Tuple of (surface, position) as expected by Surface.blits.
+        """
         border_padding = 5
-        pygame.draw.rect(
-            screen,
+        layer = render_border(
+            self.width + 2 * border_padding,
+            self.height + 2 * border_padding,
             border_color,
-            (
-                self.x - border_padding,
-                self.y - border_padding,
-                self.width + 2 * border_padding,
-                self.height + 2 * border_padding,
-            ),
             border_width,
-        )
-
-        # Draw card image
-        screen.blit(self.card_image, (self.x, self.y))
+        ).copy()
+        layer.blit(self.card_image, (border_padding, border_padding))
 
-        # Draw checkmark if selected
-        if self.selected:
-            # Draw a semi-transparent green overlay
+        if selected:
+            # Semi-transparent green overlay on the opaque card
             overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             overlay.fill((50, 255, 50, 80))
-            screen.blit(overlay, (self.x, self.y))
+            layer.blit(overlay, (border_padding, border_padding))
 
-            # Draw checkmark - scale font size based on card height
+            # Checkmark - scale font size based on card height
             font_size = int(self.height * 0.53)  # 53% of card height
-            font = pygame.font.Font(None, font_size)
-            checkmark = font.render("✓", ANTI_ALIASING, (255, 255, 255))
-            checkmark_rect = checkmark.get_rect(
-                center=(self.x + self.width // 2, self.y + self.height // 2)
+            checkmark = render_text(
+                "✓", font_size, (255, 255, 255), antialias=ANTI_ALIASING
             )
-            screen.blit(checkmark, checkmark_rect)
+            checkmark_rect = checkmark.get_rect(center=layer.get_rect().center)
+            layer.blit(checkmark, checkmark_rect)
+
+        return layer.convert_alpha(), (self.x - border_padding, self.y - border_padding)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw the button.
+
+        Args:
+            screen: The pygame display surface.
+        """
+        # Pick the pre-composed layer for the current state
+        if self.selected:
+            state = "selected"
+        elif self.hovered:
+            state = "hovered"
+        else:
+            state = "idle"
+        screen.blit(*self.state_layers[state])
 
 
 class SubmitButton:
@@ -107,8 +128,62 @@ class SubmitButton:
         self.y = y
         self.width = width
         self.height = height
+        # hit box for hover and click checks
+        self.rect = pygame.Rect(x, y, width, height)
         self.hovered = False
         self.enabled = False
+        # the button looks the same in each state, so render each one once,
+        # keyed by (enabled, hovered)
+        disabled_surface = self._build_state_surface(
+            (100, 100, 100),  # Gray for disabled
+            (150, 150, 150),  # Light gray text
+            (80, 80, 80),
+        )
+        self.state_surfaces = {
+            (False, False): disabled_surface,
+            (False, True): disabled_surface,
+            (True, True): self._build_state_surface(
+                (100, 200, 255),  # Light blue for hover
+                (0, 0, 0),  # Black text
+                (50, 150, 255),
+            ),
+            (True, False): self._build_state_surface(
+                (50, 150, 50),  # Green for enabled
+                (255, 255, 255),  # White text
+                (30, 100, 30),
+            ),
+        }
+
+    def _build_state_surface(
+        self,
+        bg_color: tuple[int, int, int],
+        text_color: tuple[int, int, int],
+        border_color: tuple[int, int, int],
+    ) -> pygame.Surface:
+        """Render the button in one visual state.
+
+        Args:
+            bg_color: Background color of the button.
+            text_color: Color of the button text.
+            border_color: Color of the button border.
+
+        Returns:
+            The rendered button.
+        """
+        button_surface = pygame.Surface((self.width, self.height)).convert()
+
+        # Draw button background and border
+        button_surface.fill(bg_color)
+        pygame.draw.rect(button_surface, border_color, button_surface.get_rect(), 3)
+
+        # Draw button text - scale font size based on button height
+        font_size = int(self.height * 0.72)  # 72% of button height
+        text_surface = render_text(
+            "Submit", font_size, text_color, antialias=ANTI_ALIASING
+        )
+        text_rect = text_surface.get_rect(center=(self.width // 2, self.height // 2))
+        button_surface.blit(text_surface, text_rect)
+        return button_surface
 
     def is_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """Check if the button was clicked.
@@ -120,12 +195,7 @@ class SubmitButton:
         Returns:
             True if the button was clicked and is enabled.
         """
-        if not self.enabled:
-            return False
-        return (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        return self.enabled and bool(self.rect.collidepoint(mouse_x, mouse_y))
 
     def update_hover(self, mouse_x: int, mouse_y: int) -> None:
         """Update hover state based on mouse position.
@@ -134,10 +204,7 @@ class SubmitButton:
             mouse_x: Mouse x coordinate.
             mouse_y: Mouse y coordinate.
         """
-        self.hovered = (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        self.hovered = bool(self.rect.collidepoint(mouse_x, mouse_y))
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the button.
@@ -145,36 +212,8 @@ class SubmitButton:
         Args:
             screen: The pygame display surface.
         """
-        # Determine button color based on state
-        if not self.enabled:
-            bg_color = (100, 100, 100)  # Gray for disabled
-            text_color = (150, 150, 150)  # Light gray text
-            border_color = (80, 80, 80)
-        elif self.hovered:
-            bg_color = (100, 200, 255)  # Light blue for hover
-            text_color = (0, 0, 0)  # Black text
-            border_color = (50, 150, 255)
-        else:
-            bg_color = (50, 150, 50)  # Green for enabled
-            text_color = (255, 255, 255)  # White text
-            border_color = (30, 100, 30)
-
-        # Draw button background
-        pygame.draw.rect(screen, bg_color, (self.x, self.y, self.width, self.height))
-
-        # Draw button border
-        pygame.draw.rect(
-            screen, border_color, (self.x, self.y, self.width, self.height), 3
-        )
-
-        # Draw button text - scale font size based on button height
-        font_size = int(self.height * 0.72)  # 72% of button height
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render("Submit", ANTI_ALIASING, text_color)
-        text_rect = text_surface.get_rect(
-            center=(self.x + self.width // 2, self.y + self.height // 2)
-        )
-        screen.blit(text_surface, text_rect)
+        # Blit the pre-rendered surface for the current state
+        screen.blit(self.state_surfaces[self.enabled, self.hovered], self.rect)
 
 
 class CardsSelector(BaseSelector["VisualCard"]):
@@ -201,6 +240,7 @@ class CardsSelector(BaseSelector["VisualCard"]):
             max_selections=len(available_cards),  # Can select all cards
             validation_func=validation_func,
         )
+        self.instruction_text = self._render_instruction(0, is_valid=False)
 
     def _get_button_dimensions(self) -> tuple[int, int, int]:
         """Get button dimensions (width, height, spacing).
@@ -240,6 +280,12 @@ class CardsSelector(BaseSelector["VisualCard"]):
             - int(APP_HEIGHT * 0.06)
         )
 
+        # Keep the grid layout, so the button under the mouse can be computed
+        self.grid_start_y = start_y
+        self.grid_pitch = (card_width + card_spacing, card_height + card_spacing)
+        self.grid_columns = max_cards_per_row
+        self.grid_row_starts: list[int] = []
+
         # Create buttons for each card
         for i, card in enumerate(self.items):
             row = i // max_cards_per_row
@@ -247,12 +293,14 @@ class CardsSelector(BaseSelector["VisualCard"]):
             cards_in_row = min(max_cards_per_row, num_cards - row * max_cards_per_row)
             row_width = cards_in_row * card_width + (cards_in_row - 1) * card_spacing
             start_x = int((APP_WIDTH - row_width) // 2)
+            if col == 0:
+                self.grid_row_starts.append(start_x)
 
             x = start_x + col * (card_width + card_spacing)
             y = start_y + row * (card_height + card_spacing)
 
-            # Scale card image
-            card_image = pygame.transform.scale(card.png, (card_width, card_height))
+            # Scaled card image in display format, shared by identical cards
+            card_image = load_scaled_image(card.get_png_path(), card_width, card_height)
             button = MultiCardButton(x, y, card_width, card_height, card, card_image)
             self.buttons.append(button)
 
@@ -266,9 +314,44 @@ class CardsSelector(BaseSelector["VisualCard"]):
         )
 
     def _update_submit_button_state(self) -> None:
-        """Update the submit button enabled state based on selected cards."""
+        """Update the submit button and instruction based on selected cards."""
+        is_valid = self._is_valid_selection()
         if self.submit_button:
-            self.submit_button.enabled = self._is_valid_selection()
+            self.submit_button.enabled = is_valid
+        # the instruction only depends on the selection, so render it here
+        # once per change instead of every frame
+        self.instruction_text = self._render_instruction(
+            self.selected_count, is_valid=is_valid
+        )
+
+    def _render_instruction(
+        self, selected_count: int, *, is_valid: bool
+    ) -> pygame.Surface:
+        """Render the instruction text for the current selection.
+
+        Args:
+            selected_count: Number of currently selected cards.
+            is_valid: Whether the selected cards form a valid group.
+
+        Returns:
+            The rendered instruction text.
+        """
+        if selected_count:
+            if is_valid:
+                instruction = f"Selected {selected_count} cards - Valid group!"
+                color = (50, 255, 50)  # Green
+            else:
+                instruction = f"Selected {selected_count} cards - Invalid group"
+                color = (255, 50, 50)  # Red
+        else:
+            instruction = "Click cards to select/deselect"
+            color = (200, 200, 200)  # Gray
+
+        # scale font size
+        instruction_font_size = int(APP_HEIGHT * 0.034)  # 3.4% of screen height
+        return render_text(
+            instruction, instruction_font_size, color, antialias=ANTI_ALIASING
+        )
 
     def show(self) -> list["VisualCard"]:
         """Show the cards selector and wait for user input.
@@ -278,14 +361,19 @@ class CardsSelector(BaseSelector["VisualCard"]):
         """
         clock = pygame.time.Clock()
 
+        # Keep what is behind the dialog so it can be redrawn on top of it
+        background = self.screen.copy()
+        needs_redraw = True
+
         while True:
             # Handle events
-            for event in pygame.event.get():
+            for event in wait_for_events([pygame.QUIT, pygame.MOUSEBUTTONDOWN]):
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     raise SystemExit
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
+                    # the click position is part of the event
+                    mouse_x, mouse_y = event.pos
 
                     # Check if submit button was clicked
                     if self.submit_button and self.submit_button.is_clicked(
@@ -294,27 +382,64 @@ class CardsSelector(BaseSelector["VisualCard"]):
                         return self._get_selected_items()
 
                     # Check if any card button was clicked
-                    for button in self.buttons:
-                        if button.is_clicked(mouse_x, mouse_y):
-                            button.toggle_selection(
-                                len(self._get_selected_items()), self.max_selections
-                            )
-                            self._update_submit_button_state()
-                            break
+                    button = self._get_clicked_button(mouse_x, mouse_y)
+                    if button is not None:
+                        self._toggle_selection(button)
+                        self._update_submit_button_state()
+                        needs_redraw = True
 
             # Update hover state
             mouse_x, mouse_y = pygame.mouse.get_pos()
-            for button in self.buttons:
-                button.update_hover(mouse_x, mouse_y)
-            if self.submit_button:
-                self.submit_button.update_hover(mouse_x, mouse_y)
+            if self._update_hover(mouse_x, mouse_y):
+                needs_redraw = True
+
+            # Only draw and present frames in which something changed
+            if needs_redraw:
+                self.screen.blit(background, (0, 0))
+                self._draw()
+                pygame.display.flip()
+                needs_redraw = False
+            clock.tick(60)  # 60 FPS
 
-            # Draw
-            self._draw()
+    def _get_button_index(self, mouse_x: int, mouse_y: int) -> int:
+        """Get the index of the card button under the mouse from the grid.
 
-            # Update display
-            pygame.display.flip()
-            clock.tick(60)  # 60 FPS
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
+
+        Returns:
+            The index of the button, or -1 if there is none.
+        """
+        pitch_x, pitch_y = self.grid_pitch
+        row = (mouse_y - self.grid_start_y) // pitch_y
+        if not 0 <= row < len(self.grid_row_starts):
+            return -1
+        col = (mouse_x - self.grid_row_starts[row]) // pitch_x
+        index = row * self.grid_columns + col
+        if not 0 <= col < self.grid_columns or index >= len(self.buttons):
+            return -1
+        # the mouse can be in the gap between two buttons
+        if not self.buttons[index].rect.collidepoint(mouse_x, mouse_y):
+            return -1
+        return index
+
+    def _update_hover(self, mouse_x: int, mouse_y: int) -> bool:
+        """Update the hover state of the card buttons and the submit button.
+
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
+
+        Returns:
+            True if the hover state of any button changed.
+        """
+        changed = super()._update_hover(mouse_x, mouse_y)
+        if self.submit_button:
+            was_hovered = self.submit_button.hovered
+            self.submit_button.update_hover(mouse_x, mouse_y)
+            changed = changed or self.submit_button.hovered != was_hovered
+        return changed
 
     def _draw(self) -> None:
         """Draw the cards selector dialog."""
@@ -325,28 +450,11 @@ class CardsSelector(BaseSelector["VisualCard"]):
         _dialog_width, dialog_height = self._get_dialog_dimensions()
         dialog_y = int((APP_HEIGHT - dialog_height) // 2)
 
-        # Draw instruction - scale font size
-        instruction_font_size = int(APP_HEIGHT * 0.034)  # 3.4% of screen height
-        instruction_font = pygame.font.Font(None, instruction_font_size)
-        selected_cards = self._get_selected_items()
-        is_valid = self._is_valid_selection()
-
-        if selected_cards:
-            if is_valid:
-                instruction = f"Selected {len(selected_cards)} cards - Valid group!"
-                color = (50, 255, 50)  # Green
-            else:
-                instruction = f"Selected {len(selected_cards)} cards - Invalid group"
-                color = (255, 50, 50)  # Red
-        else:
-            instruction = "Click cards to select/deselect"
-            color = (200, 200, 200)  # Gray
-
-        instruction_text = instruction_font.render(instruction, ANTI_ALIASING, color)
-        instruction_rect = instruction_text.get_rect(
+        # Draw instruction
+        instruction_rect = self.instruction_text.get_rect(
             center=(int(APP_WIDTH // 2), dialog_y + int(APP_HEIGHT * 0.10))
         )
-        self.screen.blit(instruction_text, instruction_rect)
+        self.screen.blit(self.instruction_text, instruction_rect)
 
         # Draw submit button
         if self.submit_button:
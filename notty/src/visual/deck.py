@@ -2,6 +2,7 @@
 
 import random
 from types import ModuleType
+from typing import ClassVar
 
 import pygame
 
@@ -14,6 +15,7 @@ from notty.src.consts import (
     DECK_POS_Y,
     DECK_WIDTH,
 )
+from notty.src.utils import get_font
 from notty.src.visual.base import Visual
 from notty.src.visual.card import Color, Number, VisualCard
 
@@ -23,22 +25,29 @@ class VisualDeck(Visual):
 
     NUM_DUPLICATES = 2
 
-    def draw(self) -> None:
-        """Draw the visual element.
+    # one generator shared by all decks for shuffling and random inserts
+    RNG: ClassVar[random.Random] = random.Random()
 
-        Args:
-            screen: The pygame display surface.
+    def get_visuals(self) -> list[Visual]:
+        """Get the cards still flying in and the deck in drawing order."""
+        # Cards resting in the middle of the deck are covered by the deck image,
+        # so only the ones still flying in need to be drawn
+        return [*(card for card in self.cards if card.is_moving()), self]
+
+    def get_blit_pairs(
+        self,
+    ) -> list[tuple[pygame.Surface, pygame.Vector2 | tuple[int, int]]]:
+        """Get the deck and the number of cards on it in black, bottom to top.
+
+        The label is part of the deck, so cards drawn later pass over it.
+
+        Returns:
+            List of (surface, position) as expected by Surface.blits.
         """
-        for card in self.cards:
-            card.draw()
-        super().draw()
-        # Cards stay hidden behind the deck - only draw the deck image
-        # draw the number of cards in the deck in black - scale font size
-        font_size = int(APP_HEIGHT * 0.12)  # 12% of screen height
-        font = pygame.font.Font(None, font_size)
-        text = font.render(str(self.size()), ANTI_ALIASING, (0, 0, 0))
-        text_padding = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
-        self.screen.blit(text, (self.x + text_padding, self.y + text_padding))
+        return [
+            (self.png, self.position),
+            (self.get_size_label(), self.size_label_pos),
+        ]
 
     def __init__(
         self,
@@ -55,18 +64,45 @@ class VisualDeck(Visual):
             deck: The deck to visualize.
         """
         self.cards: list[VisualCard] = []
+        self.size_label: pygame.Surface | None = None
+        self.size_label_count = 0
+        # the deck never moves, so the label layout is fixed
+        text_padding = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
+        self.size_label_pos = (DECK_POS_X + text_padding, DECK_POS_Y + text_padding)
+        self.size_label_font = get_font(int(APP_HEIGHT * 0.12))  # 12% of height
         super().__init__(DECK_POS_X, DECK_POS_Y, DECK_HEIGHT, DECK_WIDTH, screen)
         self._initialize_deck()
 
+    def get_size_label(self) -> pygame.Surface:
+        """Get the rendered label showing the number of cards in the deck.
+
+        The label is only re-rendered when the number of cards changed.
+
+        Returns:
+            The rendered label.
+        """
+        size = self.size()
+        if self.size_label is None or self.size_label_count != size:
+            self.size_label = self.size_label_font.render(
+                str(size), ANTI_ALIASING, (0, 0, 0)
+            )
+            self.size_label_count = size
+        return self.size_label
+
     def _initialize_deck(self) -> None:
         """Create all 90 cards (2 of each color-number combination)."""
         self.cards = []
-        for color in Color.get_all_colors():
-            for number in Number.get_all_numbers():
-                for _ in range(self.NUM_DUPLICATES):
-                    self.add_card(
-                        VisualCard(color, number, DECK_POS_X, DECK_POS_Y, self.screen)
-                    )
+        # create the cards where they rest in the deck, so they do not
+        # have to be moved there
+        x, y = self.get_center()
+        self.add_cards(
+            [
+                VisualCard(color, number, x, y, self.screen)
+                for color in Color.get_all_colors()
+                for number in Number.get_all_numbers()
+                for _ in range(self.NUM_DUPLICATES)
+            ]
+        )
 
     def get_png_name(self) -> str:
         """Get the png for the visual element."""
@@ -78,7 +114,7 @@ class VisualDeck(Visual):
 
     def shuffle(self) -> None:
         """Shuffle the deck."""
-        random.shuffle(self.cards)
+        self.RNG.shuffle(self.cards)
 
     def draw_card(self) -> VisualCard:
         """Draw the top card from the deck.
@@ -114,8 +150,13 @@ class VisualDeck(Visual):
         Args:
             cards: List of cards to add back to the deck.
         """
+        # move the cards to the middle of the deck
+        x, y = self.get_center()
         for card in cards:
-            self.add_card(card)
+            card.move(x, y)
+        self.cards.extend(cards)
+        # shuffle once for all cards instead of once per card
+        self.shuffle()
 
     def add_card(self, card: VisualCard) -> None:
         """Add a single card back to the deck (used when discarding).
@@ -123,11 +164,12 @@ class VisualDeck(Visual):
         Args:
             card: VisualCard to add back to the deck.
         """
-        self.cards.append(card)
+        # inserting at a random position keeps the deck shuffled
+        # without shuffling all of it again
+        self.cards.insert(self.RNG.randrange(len(self.cards) + 1), card)
         # move the card to the middle of the deck
         x, y = self.get_center()
         card.move(x, y)
-        self.shuffle()
 
     def is_empty(self) -> bool:
         """Check if the deck is empty.
@@ -43,6 +43,9 @@ class VisualGame(Visual):
             screen: The pygame display surface.
         """
         super().__init__(0, 0, APP_HEIGHT, APP_WIDTH, screen)
+        # the background is opaque and blitted over the whole screen every frame,
+        # so match the display pixel format once instead of converting per blit
+        self.png = self.png.convert()
         self.num_players = len(players)
         if not MIN_PLAYERS <= self.num_players <= MAX_PLAYERS:
             msg = f"""
@@ -52,9 +55,22 @@ class VisualGame(Visual):
             raise ValueError(msg)
 
         self.players = players
+        # hands never move, so the turn borders can be computed once
+        self.hand_borders = [self.get_hand_border(player) for player in players]
+        # the players never change during a game, so the opponents of each
+        # player are listed once instead of on every lookup
+        self.other_players = [
+            [p for j, p in enumerate(players) if j != i] for i in range(len(players))
+        ]
         self.deck = VisualDeck(screen=self.screen)
         self.current_player_index = 0
         self.winner: VisualPlayer | None = None
+        # bumped whenever the game state changes, so views can skip
+        # recomputing things derived from an unchanged state
+        self.state_version = 0
+        # possible actions of the current state, see get_possible_actions
+        self.possible_actions: frozenset[str] = frozenset()
+        self.possible_actions_version = -1
 
         # Track which actions have been used how many times
         self.actions_used: dict[str, int] = dict.fromkeys(Action.get_all_actions(), 0)
@@ -67,37 +83,59 @@ class VisualGame(Visual):
         self.computer_action_delay = 1000  # 1 second in milliseconds
 
         self.setup()
+        self.mark_state_changed()
 
     def draw(self) -> None:
         """Draw the game."""
         super().draw()
-        self.deck.draw()
-        for player in self.players:
-            player.draw()
         self.draw_current_player_border()
         self.action_board.draw()
 
+    def get_visuals(self) -> list[Visual]:
+        """Get the background, the deck and the players in drawing order."""
+        visuals: list[Visual] = [self, *self.deck.get_visuals()]
+        for player in self.players:
+            visuals.extend(player.get_visuals())
+        return visuals
+
     def draw_current_player_border(self) -> None:
         """Draw a black rectangle around the current player's hand."""
-        current_player = self.get_current_player()
-        hand = current_player.hand
-
         # Draw a black rectangle border around the hand
         border_width = 5
-        border_padding = 10
-
         pygame.draw.rect(
             self.screen,
             (0, 0, 0),  # Black color
-            (
-                hand.x - border_padding,
-                hand.y - border_padding,
-                hand.width + 2 * border_padding,
-                hand.height + 2 * border_padding,
-            ),
+            self.hand_borders[self.current_player_index],
             border_width,
         )
 
+    def get_hand_border(self, player: VisualPlayer) -> pygame.Rect:
+        """Get the rectangle of the border around a player's hand.
+
+        Args:
+            player: The player whose hand is framed.
+
+        Returns:
+            The border rectangle.
+        """
+        hand = player.hand
+        border_padding = 10
+        return pygame.Rect(
+            hand.x - border_padding,
+            hand.y - border_padding,
+            hand.width + 2 * border_padding,
+            hand.height + 2 * border_padding,
+        )
+
+    def mark_state_changed(self) -> None:
+        """Mark that the game state changed.
+
+        The action buttons are updated right away, as they only depend on
+        the game state and not on the frame being drawn.
+        """
+        self.state_version += 1
+        self.action_board.update_button_states(self)
+
     def get_png_name(self) -> str:
         """Get the png for the visual element."""
         return "icon"
@@ -133,6 +171,14 @@ class VisualGame(Visual):
         """
         return self.players[self.current_player_index]
 
+    def is_computer_turn(self) -> bool:
+        """Check if the current player is a computer player.
+
+        Returns:
+            True if a computer player is on turn.
+        """
+        return not self.get_current_player().is_human
+
     def can_computer_act(self) -> bool:
         """Check if enough time has passed for computer to take an action.
 
@@ -152,9 +198,9 @@ class VisualGame(Visual):
         """Get all players except the current player.
 
         Returns:
-            List of other players.
+            List of other players. The list is shared, do not modify it.
         """
-        return [p for i, p in enumerate(self.players) if i != self.current_player_index]
+        return self.other_players[self.current_player_index]
 
     def get_next_player(self) -> VisualPlayer:
         """Get the next player.
@@ -566,11 +612,22 @@ class VisualGame(Visual):
         for player in game.players:
             cards = game.deck.draw_cards(INITIAL_HAND_SIZE)
             player.hand.add_cards(cards)
+        game.mark_state_changed()
 
     def all_players_have_no_cards(self) -> bool:
         """Check if all players have no cards."""
         return all(player.hand.is_empty() for player in self.players)
 
+    def is_animating(self) -> bool:
+        """Check if any card is still moving to its target.
+
+        Returns:
+            True if at least one card is still moving.
+        """
+        return any(card.is_moving() for card in self.deck.cards) or any(
+            card.is_moving() for player in self.players for card in player.hand.cards
+        )
+
     def action_is_possible(self, action: str) -> bool:  # noqa: PLR0911
         """Check if an action is possible.
 
@@ -617,6 +674,23 @@ class VisualGame(Visual):
             if self.action_is_possible(action)
         ]
 
+    def get_possible_actions(self) -> frozenset[str]:
+        """Get the set of possible actions in the current state.
+
+        The set is only recomputed when the game state changed.
+
+        Returns:
+            The possible actions.
+        """
+        if self.possible_actions_version != self.state_version:
+            self.possible_actions = frozenset(
+                action
+                for action in Action.get_all_actions()
+                if self.action_is_possible(action)
+            )
+            self.possible_actions_version = self.state_version
+        return self.possible_actions
+
     def do_action(  # noqa: PLR0911
         self,
         action: str,
@@ -637,19 +711,23 @@ class VisualGame(Visual):
         Returns:
             True if action was successful.
         """
-        if action == Action.PLAY_FOR_ME:
-            return self.play_for_me()
-        if action == Action.DRAW_MULTIPLE:
-            return self.player_draws_multiple(count=count)
-        if action == Action.STEAL:
-            return self.player_steals(target_player=target_player)
-        if action == Action.DRAW_DISCARD_DRAW:
-            return self.player_draw_discard_draws()
-        if action == Action.DRAW_DISCARD_DISCARD:
-            return self.player_draw_discard_discards(card=card)
-        if action == Action.DISCARD_GROUP:
-            return self.player_discards_group(cards=cards)
-        if action == Action.NEXT_TURN:
-            return self.player_passes()
-        msg = f"Unknown action: {action}"
-        raise ValueError(msg)
+        try:
+            if action == Action.PLAY_FOR_ME:
+                return self.play_for_me()
+            if action == Action.DRAW_MULTIPLE:
+                return self.player_draws_multiple(count=count)
+            if action == Action.STEAL:
+                return self.player_steals(target_player=target_player)
+            if action == Action.DRAW_DISCARD_DRAW:
+                return self.player_draw_discard_draws()
+            if action == Action.DRAW_DISCARD_DISCARD:
+                return self.player_draw_discard_discards(card=card)
+            if action == Action.DISCARD_GROUP:
+                return self.player_discards_group(cards=cards)
+            if action == Action.NEXT_TURN:
+                return self.player_passes()
+            msg = f"Unknown action: {action}"
+            raise ValueError(msg)
+        finally:
+            # any action can change which actions are possible
+            self.mark_state_changed()
@@ -3,6 +3,7 @@
 import pygame
 
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
+from notty.src.utils import render_text
 from notty.src.visual.base_selector import BaseSelector, SelectableButton
 
 
@@ -65,8 +66,9 @@ class NumberButton(SelectableButton[int]):
 
         # Draw button text - scale font size based on button height
         font_size = int(self.height * 0.7)  # 70% of button height
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(str(self.number), ANTI_ALIASING, text_color)
+        text_surface = render_text(
+            str(self.number), font_size, text_color, antialias=ANTI_ALIASING
+        )
         text_rect = text_surface.get_rect(
             center=(self.x + self.width // 2, self.y + self.height // 2)
         )
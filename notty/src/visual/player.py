@@ -2,6 +2,7 @@
 
 import random
 from importlib import resources
+from operator import attrgetter
 from types import ModuleType
 from typing import ClassVar
 
@@ -48,11 +49,9 @@ class VisualHand(Visual):
         )
         self.cards: list[VisualCard] = []
 
-    def draw(self) -> None:
-        """Draw the hand."""
-        super().draw()
-        for card in self.cards:
-            card.draw()
+    def get_visuals(self) -> list[Visual]:
+        """Get the hand and its cards in drawing order."""
+        return [self, *self.cards]
 
     def get_png_name(self) -> str:
         """Get the png for the visual element."""
@@ -70,7 +69,9 @@ class VisualHand(Visual):
         """
         return self.size() >= MAX_HAND_SIZE
 
-    def add_card(self, card: VisualCard, *, draw_discard_draw: bool = False) -> bool:
+    def add_card(
+        self, card: VisualCard, *, draw_discard_draw: bool = False, order: bool = True
+    ) -> bool:
         """Add a card to the hand.
 
         Args:
@@ -78,6 +79,7 @@ class VisualHand(Visual):
             draw_discard_draw: True if this is a draw and discard action.
                 This is needed because in the draw and discard action, the player
                 can draw even if hand is full.
+            order: Whether to reorder the hand afterwards.
 
         Returns:
             True if the card was added, False if hand is full.
@@ -86,7 +88,8 @@ class VisualHand(Visual):
             msg = "Hand is full"
             raise ValueError(msg)
         self.cards.append(card)
-        self.order_cards()
+        if order:
+            self.order_cards()
         return True
 
     def add_cards(self, cards: list[VisualCard]) -> dict[VisualCard, bool]:
@@ -99,15 +102,20 @@ class VisualHand(Visual):
             A dictionary mapping each card to a boolean indicating whether it was added.
         """
         cards_added: dict[VisualCard, bool] = {}
-        for card in cards:
-            cards_added[card] = self.add_card(card)
+        try:
+            for card in cards:
+                cards_added[card] = self.add_card(card, order=False)
+        finally:
+            # reposition the cards once instead of after every single card
+            self.order_cards()
         return cards_added
 
-    def remove_card(self, card: VisualCard) -> bool:
+    def remove_card(self, card: VisualCard, *, order: bool = True) -> bool:
         """Remove a specific card from the hand.
 
         Args:
             card: The card to remove.
+            order: Whether to reorder the hand afterwards.
 
         Returns:
             True if the card was removed, False if card not in hand.
@@ -115,13 +123,14 @@ class VisualHand(Visual):
         if card in self.cards:
             self.cards.remove(card)
             # reposition all cards in hand
-            self.order_cards()
+            if order:
+                self.order_cards()
             return True
         return False
 
     def order_cards(self) -> None:
         """Order the cards in the hand."""
-        self.cards.sort(key=lambda card: (card.color, card.number))
+        self.cards.sort(key=attrgetter("color", "number"))
         for i, card in enumerate(self.cards):
             row = i // NUM_HAND_COLUMNS
             col = i % NUM_HAND_COLUMNS
@@ -140,7 +149,9 @@ class VisualHand(Visual):
         """
         cards_removed: dict[VisualCard, bool] = {}
         for card in cards:
-            cards_removed[card] = self.remove_card(card)
+            cards_removed[card] = self.remove_card(card, order=False)
+        # reposition the remaining cards once
+        self.order_cards()
         return cards_removed
 
     def is_empty(self) -> bool:
@@ -187,10 +198,9 @@ class VisualPlayer(Visual):
         super().__init__(x, y, PLAYER_HEIGHT, PLAYER_WIDTH, screen)
         self.hand = VisualHand(player=self)
 
-    def draw(self) -> None:
-        """Draw the player."""
-        super().draw()
-        self.hand.draw()
+    def get_visuals(self) -> list[Visual]:
+        """Get the player and its hand in drawing order."""
+        return [self, *self.hand.get_visuals()]
 
     def get_png_name(self) -> str:
         """Get the png for the visual element."""
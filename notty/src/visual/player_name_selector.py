@@ -5,6 +5,7 @@ from pyrig.dev.artifacts.resources.resource import get_resource_path
 
 from notty.dev.artifacts.resources.visuals import players
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
+from notty.src.utils import load_scaled_image, render_text, wait_for_events
 from notty.src.visual.base_selector import BaseSelector, SelectableButton
 
 
@@ -47,6 +48,50 @@ class PlayerNameButton(SelectableButton[str]):
         )
         self.player_name = player_name
         self.player_image = player_image
+        # the name only changes color, so render each variant once
+        name_font_size = int(APP_HEIGHT * 0.06)  # 6% of screen height
+        self.name_surfaces = {
+            color: render_text(
+                player_name.capitalize(),
+                name_font_size,
+                color,
+                antialias=ANTI_ALIASING,
+            )
+            # White, light blue for hover and green for selected
+            for color in ((255, 255, 255), (100, 200, 255), (50, 255, 50))
+        }
+        self.name_rect = self.name_surfaces[255, 255, 255].get_rect(
+            center=(
+                self.x + self.width // 2,
+                self.y + self.height + int(APP_HEIGHT * 0.04),
+            )
+        )
+        self.idle_layer = self._build_idle_layer()
+
+    def _build_idle_layer(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Compose the image, idle border and name into one surface.
+
+        Returns:
+            Tuple of (surface, position) as expected by Surface.blits.
+        """
+        border_padding = int(APP_WIDTH * 0.008)  # 0.8% of screen width
+        border_rect = pygame.Rect(
+            self.x - border_padding,
+            self.y - border_padding,
+            self.width + 2 * border_padding,
+            self.height + 2 * border_padding,
+        )
+        name_text = self.name_surfaces[255, 255, 255]
+        name_rect = self.name_rect
+        # everything is drawn relative to the top left of the bounds
+        bounds = border_rect.union(name_rect)
+        layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        pygame.draw.rect(
+            layer, (255, 255, 255), border_rect.move(-bounds.x, -bounds.y), 2
+        )
+        layer.blit(self.player_image, (self.x - bounds.x, self.y - bounds.y))
+        layer.blit(name_text, name_rect.move(-bounds.x, -bounds.y))
+        return layer.convert_alpha(), bounds.topleft
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the button.
@@ -82,24 +127,8 @@ class PlayerNameButton(SelectableButton[str]):
         # Draw player image
         screen.blit(self.player_image, (self.x, self.y))
 
-        # Draw player name
-        name_font_size = int(APP_HEIGHT * 0.06)  # 6% of screen height
-        name_font = pygame.font.Font(None, name_font_size)
-        color = (
-            (50, 255, 50)
-            if self.selected
-            else ((100, 200, 255) if self.hovered else (255, 255, 255))
-        )
-        name_text = name_font.render(
-            self.player_name.capitalize(), ANTI_ALIASING, color
-        )
-        name_rect = name_text.get_rect(
-            center=(
-                self.x + self.width // 2,
-                self.y + self.height + int(APP_HEIGHT * 0.04),
-            )
-        )
-        screen.blit(name_text, name_rect)
+        # Draw the pre-rendered player name
+        screen.blit(self.name_surfaces[border_color], self.name_rect)
 
 
 class PlayerNameSelector(BaseSelector[str]):
@@ -131,6 +160,18 @@ class PlayerNameSelector(BaseSelector[str]):
             items=available_names,
             max_selections=max_selections,
         )
+        # the instruction never changes, render it once
+        instruction_font_size = int(APP_HEIGHT * 0.045)  # 4.5% of screen height
+        if self.needs_submit:
+            instruction = "Click to select/deselect • Press ENTER when done"
+        else:
+            instruction = "Click on a player to select"
+        self.instruction_surface = render_text(
+            instruction, instruction_font_size, (255, 255, 255), antialias=ANTI_ALIASING
+        )
+        self.instruction_rect = self.instruction_surface.get_rect(
+            center=(APP_WIDTH // 2, int(APP_HEIGHT * 0.22))
+        )
 
     def _get_button_dimensions(self) -> tuple[int, int, int]:
         """Get button dimensions (width, height, spacing).
@@ -155,12 +196,13 @@ class PlayerNameSelector(BaseSelector[str]):
         """Set up the player name buttons."""
         image_size, _, _spacing = self._get_button_dimensions()
 
-        # Load player images
-        player_images: dict[str, pygame.Surface] = {}
-        for name in self.items:
-            png_path = get_resource_path(name + ".png", players)
-            img = pygame.image.load(png_path)
-            player_images[name] = pygame.transform.scale(img, (image_size, image_size))
+        # Load player images, cached across selectors
+        player_images = {
+            name: load_scaled_image(
+                get_resource_path(name + ".png", players), image_size, image_size
+            )
+            for name in self.items
+        }
 
         # Calculate positions - center horizontally
         player_spacing = APP_WIDTH // (len(self.items) + 1)
@@ -180,80 +222,118 @@ class PlayerNameSelector(BaseSelector[str]):
             )
             self.buttons.append(button)
 
-    def _draw(self) -> None:
-        """Draw the player name selector."""
-        # Draw black background (no overlay for full screen)
-        self.screen.fill((0, 0, 0))
+    def _render_title(self) -> tuple[pygame.Surface, pygame.Rect]:
+        """Render the full screen title, which never changes.
 
-        # Draw title
+        Returns:
+            Tuple of (title_surface, title_rect).
+        """
         title_font_size = int(APP_HEIGHT * 0.09)  # 9% of screen height
-        title_font = pygame.font.Font(None, title_font_size)
-        title_text = title_font.render(self.title, ANTI_ALIASING, (255, 255, 255))
-        title_rect = title_text.get_rect(
+        title_surface = render_text(
+            self.title, title_font_size, (255, 255, 255), antialias=ANTI_ALIASING
+        )
+        title_rect = title_surface.get_rect(
             center=(APP_WIDTH // 2, int(APP_HEIGHT * 0.12))
         )
-        self.screen.blit(title_text, title_rect)
+        return title_surface, title_rect
 
-        # Draw instruction
-        instruction_font_size = int(APP_HEIGHT * 0.045)  # 4.5% of screen height
-        instruction_font = pygame.font.Font(None, instruction_font_size)
-        if self.needs_submit:
-            instruction = "Click to select/deselect • Press ENTER when done"
-        else:
-            instruction = "Click on a player to select"
-        instruction_text = instruction_font.render(
-            instruction, ANTI_ALIASING, (255, 255, 255)
-        )
-        instruction_rect = instruction_text.get_rect(
-            center=(APP_WIDTH // 2, int(APP_HEIGHT * 0.22))
-        )
-        self.screen.blit(instruction_text, instruction_rect)
+    def _build_chrome(self) -> None:
+        """Skip the overlay and dialog box, the selector fills the screen.
+
+        Returns:
+            None, the background is filled in _draw.
+        """
+
+    def _draw(self) -> None:
+        """Draw the player name selector."""
+        # Draw black background (no overlay for full screen)
+        self.screen.fill((0, 0, 0))
+
+        # Draw title and instruction
+        self.screen.blit(self.title_surface, self.title_rect)
+        self.screen.blit(self.instruction_surface, self.instruction_rect)
 
         # Draw buttons
-        for button in self.buttons:
-            button.draw(self.screen)
+        self._draw_buttons()
 
-    def show(self) -> str | list[str]:  # noqa: C901
+    def show(self) -> str | list[str]:
         """Show the player name selector and wait for user input.
 
         Returns:
             Selected player name (single) or list of names (multiple).
         """
+        if self.needs_submit:
+            return self.show_multi()
+        return self.show_single()
+
+    def show_single(self) -> str:
+        """Show the selector and return the first clicked player.
+
+        Returns:
+            The selected player name.
+        """
         clock = pygame.time.Clock()
+        needs_redraw = True
 
         while True:
             # Handle events
-            for event in pygame.event.get():
+            for event in wait_for_events([pygame.QUIT, pygame.MOUSEBUTTONDOWN]):
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     raise SystemExit
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-                    for button in self.buttons:
-                        if button.is_clicked(mouse_x, mouse_y):
-                            if self.needs_submit:
-                                # Multi-select mode: toggle selection
-                                current_count = len(self._get_selected_items())
-                                button.toggle_selection(
-                                    current_count, self.max_selections
-                                )
-                            else:
-                                # Single-select mode: return immediately
-                                return button.item
-                elif event.type == pygame.KEYDOWN and self.needs_submit:
-                    if event.key == pygame.K_RETURN:
-                        selected = self._get_selected_items()
-                        if len(selected) >= self.min_selections:
-                            return selected
-
-            # Update hover state
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            for button in self.buttons:
-                button.update_hover(mouse_x, mouse_y)
-
-            # Draw
-            self._draw()
+                    # the click position is part of the event
+                    button = self._get_clicked_button(*event.pos)
+                    if button is not None:
+                        return button.item
+
+            self._update_frame(clock, needs_redraw=needs_redraw)
+            needs_redraw = False
+
+    def show_multi(self) -> list[str]:
+        """Show the selector and let the user select players until ENTER.
+
+        Returns:
+            The selected player names.
+        """
+        clock = pygame.time.Clock()
+        needs_redraw = True
+
+        while True:
+            # Handle events
+            for event in wait_for_events(
+                [pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN]
+            ):
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    raise SystemExit
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    # the click position is part of the event
+                    button = self._get_clicked_button(*event.pos)
+                    if button is not None:
+                        self._toggle_selection(button)
+                        needs_redraw = True
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+                    if self.selected_count >= self.min_selections:
+                        return self._get_selected_items()
+
+            self._update_frame(clock, needs_redraw=needs_redraw)
+            needs_redraw = False
 
-            # Update display
+    def _update_frame(self, clock: pygame.time.Clock, *, needs_redraw: bool) -> None:
+        """Update hover states and draw the frame if anything changed.
+
+        Args:
+            clock: The clock limiting the frame rate.
+            needs_redraw: Whether the selection changed since the last frame.
+        """
+        # Update hover state
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        if self._update_hover(mouse_x, mouse_y):
+            needs_redraw = True
+
+        # Only draw and present frames in which something changed
+        if needs_redraw:
+            self._draw()
             pygame.display.flip()
-            clock.tick(60)  # 60 FPS
+        clock.tick(60)  # 60 FPS
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 import pygame
 
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
+from notty.src.utils import load_scaled_image, render_text
 from notty.src.visual.base_selector import BaseSelector, SelectableButton
 
 if TYPE_CHECKING:
@@ -72,9 +73,10 @@ class PlayerButton(SelectableButton["VisualPlayer"]):
 
         # Draw player name below the image - scale font size
         font_size = int(self.height * 0.24)  # 24% of image height
-        font = pygame.font.Font(None, font_size)
         text_color = (100, 200, 255) if self.hovered else (255, 255, 255)
-        text_surface = font.render(self.player.name, ANTI_ALIASING, text_color)
+        text_surface = render_text(
+            self.player.name, font_size, text_color, antialias=ANTI_ALIASING
+        )
         text_rect = text_surface.get_rect(
             center=(
                 self.x + self.width // 2,
@@ -137,7 +139,9 @@ class PlayerSelector(BaseSelector["VisualPlayer"]):
         # Create buttons for each player
         for i, player in enumerate(self.items):
             x = start_x + i * (image_size + button_spacing)
-            # Load and scale player image
-            player_image = pygame.transform.scale(player.png, (image_size, image_size))
+            # Scaled player image in display format, cached across dialogs
+            player_image = load_scaled_image(
+                player.get_png_path(), image_size, image_size
+            )
             button = PlayerButton(x, y, image_size, image_size, player, player_image)
             self.buttons.append(button)
@@ -3,14 +3,23 @@
 from typing import TYPE_CHECKING
 
 import pygame
-from pyrig.dev.artifacts.resources.resource import get_resource_path
 
-from notty.dev.artifacts.resources.visuals import players
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
+from notty.src.utils import load_scaled_image, render_text, wait_for_events
 
 if TYPE_CHECKING:
     from notty.src.visual.player import VisualPlayer
 
+# (label, result, normal color, hover color) of the buttons, top to bottom
+WINNER_BUTTONS: tuple[
+    tuple[str, str, tuple[int, int, int], tuple[int, int, int]], ...
+] = (
+    # Green, lighter green on hover
+    ("Start New Game", "new_game", (50, 150, 50), (70, 200, 70)),
+    # Red, lighter red on hover
+    ("Quit", "quit", (150, 50, 50), (200, 70, 70)),
+)
+
 
 class WinnerDisplay:
     """Dialog for displaying the winner of the game."""
@@ -27,10 +36,12 @@ class WinnerDisplay:
         self.winner_name = winner.name
 
         # Load and scale the winner's image - scale proportionally
-        png_path = get_resource_path(winner.name + ".png", players)
-        img = pygame.image.load(png_path)
         image_size = int(APP_HEIGHT * 0.24)  # 24% of screen height
-        self.winner_image = pygame.transform.scale(img, (image_size, image_size))
+        # in display format, cached across dialogs, the image is only scaled
+        # once so it is filtered for a smoother portrait
+        self.winner_image = load_scaled_image(
+            winner.get_png_path(), image_size, image_size, smooth=True
+        )
 
         # Button properties - scale proportionally
         self.button_width = int(APP_WIDTH * 0.22)  # 22% of screen width
@@ -42,30 +53,78 @@ class WinnerDisplay:
         dialog_height = int(APP_HEIGHT * 0.66)  # 66% of screen height
         dialog_x = int((APP_WIDTH - dialog_width) // 2)
         dialog_y = int((APP_HEIGHT - dialog_height) // 2)
+        self.dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
+
+        # Winner image, centered below the title
+        self.image_rect = pygame.Rect(
+            int((APP_WIDTH - image_size) // 2),
+            dialog_y + int(APP_HEIGHT * 0.17),
+            image_size,
+            image_size,
+        )
+
+        # Buttons stacked in the lower part of the dialog, the hit boxes are
+        # kept in a list, so the mouse is checked with one C call
+        button_x = dialog_x + (dialog_width - self.button_width) // 2
+        buttons_y = dialog_y + dialog_height - int(APP_HEIGHT * 0.17)
+        self.button_rects = [
+            pygame.Rect(
+                button_x,
+                buttons_y + i * (self.button_height + self.button_spacing),
+                self.button_width,
+                self.button_height,
+            )
+            for i in range(len(WINNER_BUTTONS))
+        ]
 
-        # New Game button
-        self.new_game_button_rect = pygame.Rect(
-            dialog_x + (dialog_width - self.button_width) // 2,
-            dialog_y + dialog_height - int(APP_HEIGHT * 0.17),
-            self.button_width,
-            self.button_height,
+        # index of the hovered button, -1 if none
+        self.hovered_index = -1
+
+        # The texts never change, so render them once
+        # "WINNER!" title - scale font size
+        title_font_size = int(APP_HEIGHT * 0.115)  # 11.5% of screen height
+        self.title_surface = render_text(
+            "WINNER!", title_font_size, (255, 215, 0), antialias=ANTI_ALIASING
+        )
+        self.title_rect = self.title_surface.get_rect(
+            center=(int(APP_WIDTH // 2), dialog_y + int(APP_HEIGHT * 0.07))
         )
 
-        # Quit button
-        self.quit_button_rect = pygame.Rect(
-            dialog_x + (dialog_width - self.button_width) // 2,
-            dialog_y
-            + dialog_height
-            - int(APP_HEIGHT * 0.17)
-            + self.button_height
-            + self.button_spacing,
-            self.button_width,
-            self.button_height,
+        # Winner name below the image - scale font size
+        name_font_size = int(APP_HEIGHT * 0.067)  # 6.7% of screen height
+        self.name_surface = render_text(
+            self.winner_name, name_font_size, (255, 255, 255), antialias=ANTI_ALIASING
+        )
+        self.name_rect = self.name_surface.get_rect(
+            center=(
+                int(APP_WIDTH // 2),
+                self.image_rect.bottom + int(APP_HEIGHT * 0.048),
+            )
         )
 
-        # Hover states
-        self.new_game_hovered = False
-        self.quit_hovered = False
+        # Both states of each button never change, so render them once
+        button_font_size = int(APP_HEIGHT * 0.058)  # 5.8% of screen height
+        self.button_layers = [
+            self._build_button_layers(
+                rect,
+                render_text(
+                    label, button_font_size, (255, 255, 255), antialias=ANTI_ALIASING
+                ),
+                normal_color=normal_color,
+                hover_color=hover_color,
+            )
+            for rect, (label, _, normal_color, hover_color) in zip(
+                self.button_rects, WINNER_BUTTONS, strict=True
+            )
+        ]
+        # areas covered by the buttons, the only parts that change on hover
+        self.button_areas = [
+            pygame.Rect(position, surface.get_size())
+            for surface, position in (layers[False] for layers in self.button_layers)
+        ]
+
+        # Everything but the buttons never changes, so render it once
+        self.static_layer = self._build_static_layer()
 
     def show(self) -> str:
         """Show the winner display and wait for user to click a button.
@@ -76,174 +135,162 @@ class WinnerDisplay:
         Returns:
             "new_game" if user clicked Start New Game, "quit" if user clicked Quit.
         """
-        clock = pygame.time.Clock()
+        # Keep what is behind the dialog so it can be redrawn on top of it
+        background = self.screen.copy()
+
+        # Initial paint of the whole screen
+        self._draw()
+        pygame.display.flip()
 
         while True:
+            # Block until something happens (or ~one frame passes) instead of
+            # spinning and redrawing an idle dialog, this also limits the rate
+            events = wait_for_events([pygame.QUIT, pygame.MOUSEBUTTONDOWN])
+            # the mouse is read once and used for clicks and hover
+            index = self._get_button_index(*pygame.mouse.get_pos())
+
             # Handle events
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     return "quit"
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-
-                    # Check if New Game button was clicked
-                    if self.new_game_button_rect.collidepoint(mouse_x, mouse_y):
-                        return "new_game"
+                # Check if a button was clicked
+                if event.type == pygame.MOUSEBUTTONDOWN and index != -1:
+                    return WINNER_BUTTONS[index][1]
 
-                    # Check if Quit button was clicked
-                    if self.quit_button_rect.collidepoint(mouse_x, mouse_y):
-                        return "quit"
+            # Only redraw when the hover changed and only update the buttons
+            if index != self.hovered_index:
+                self.hovered_index = index
+                self.screen.blit(background, (0, 0))
+                self._draw()
+                pygame.display.update(self.button_areas)
 
-            # Update hover states
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            self.new_game_hovered = self.new_game_button_rect.collidepoint(
-                mouse_x, mouse_y
-            )
-            self.quit_hovered = self.quit_button_rect.collidepoint(mouse_x, mouse_y)
+    def _get_button_index(self, mouse_x: int, mouse_y: int) -> int:
+        """Get the index of the button under the mouse.
 
-            # Draw
-            self._draw()
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
 
-            # Update display
-            pygame.display.flip()
-            clock.tick(60)  # 60 FPS
+        Returns:
+            The index of the button in WINNER_BUTTONS, or -1 if there is none.
+        """
+        return pygame.Rect(mouse_x, mouse_y, 1, 1).collidelist(self.button_rects)
 
-    def _draw(self) -> None:
-        """Draw the winner display dialog."""
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((int(APP_WIDTH), int(APP_HEIGHT)))
-        overlay.set_alpha(220)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+    def _build_static_layer(self) -> pygame.Surface:
+        """Render everything but the buttons, which never changes.
 
-        # Draw dialog background - scale proportionally
-        dialog_width = int(APP_WIDTH * 0.52)  # 52% of screen width
-        dialog_height = int(APP_HEIGHT * 0.66)  # 66% of screen height
-        dialog_x = int((APP_WIDTH - dialog_width) // 2)
-        dialog_y = int((APP_HEIGHT - dialog_height) // 2)
+        Returns:
+            A screen-sized surface with the overlay, dialog, image and texts.
+        """
+        # Semi-transparent overlay
+        layer = pygame.Surface((int(APP_WIDTH), int(APP_HEIGHT)), pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 220))
 
         # Draw background with gradient effect (using solid color for simplicity)
-        pygame.draw.rect(
-            self.screen,
-            (20, 60, 20),  # Dark green background
-            (dialog_x, dialog_y, dialog_width, dialog_height),
-        )
+        pygame.draw.rect(layer, (20, 60, 20), self.dialog_rect)  # Dark green
 
         # Draw dialog border with gold color
         border_width = max(3, int(APP_HEIGHT * 0.006))  # 0.6% of screen height, min 3
-        pygame.draw.rect(
-            self.screen,
-            (255, 215, 0),  # Gold border
-            (dialog_x, dialog_y, dialog_width, dialog_height),
-            border_width,
-        )
+        pygame.draw.rect(layer, (255, 215, 0), self.dialog_rect, border_width)
 
         # Draw inner border for extra emphasis
         inner_border_offset = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
         pygame.draw.rect(
-            self.screen,
+            layer,
             (200, 200, 100),  # Lighter gold
-            (
-                dialog_x + inner_border_offset,
-                dialog_y + inner_border_offset,
-                dialog_width - 2 * inner_border_offset,
-                dialog_height - 2 * inner_border_offset,
+            self.dialog_rect.inflate(
+                -2 * inner_border_offset, -2 * inner_border_offset
             ),
             max(2, int(APP_HEIGHT * 0.0024)),  # 0.24% of screen height, min 2
         )
 
-        # Draw "WINNER!" title - scale font size
-        title_font_size = int(APP_HEIGHT * 0.115)  # 11.5% of screen height
-        title_font = pygame.font.Font(None, title_font_size)
-        title_text = title_font.render("WINNER!", ANTI_ALIASING, (255, 215, 0))
-        title_rect = title_text.get_rect(
-            center=(int(APP_WIDTH // 2), dialog_y + int(APP_HEIGHT * 0.07))
-        )
-        self.screen.blit(title_text, title_rect)
-
-        # Draw winner image with gold border
-        image_size = int(APP_HEIGHT * 0.24)  # 24% of screen height
-        image_x = int((APP_WIDTH - image_size) // 2)
-        image_y = dialog_y + int(APP_HEIGHT * 0.17)
+        # Draw "WINNER!" title
+        layer.blit(self.title_surface, self.title_rect)
 
         # Draw gold border around image
         border_padding = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
         pygame.draw.rect(
-            self.screen,
+            layer,
             (255, 215, 0),  # Gold border
-            (
-                image_x - border_padding,
-                image_y - border_padding,
-                image_size + 2 * border_padding,
-                image_size + 2 * border_padding,
-            ),
+            self.image_rect.inflate(2 * border_padding, 2 * border_padding),
             border_width,
         )
 
         # Draw the winner's image
-        self.screen.blit(self.winner_image, (image_x, image_y))
+        layer.blit(self.winner_image, self.image_rect)
 
-        # Draw winner name below image - scale font size
-        name_font_size = int(APP_HEIGHT * 0.067)  # 6.7% of screen height
-        name_font = pygame.font.Font(None, name_font_size)
-        name_text = name_font.render(self.winner_name, ANTI_ALIASING, (255, 255, 255))
-        name_rect = name_text.get_rect(
-            center=(int(APP_WIDTH // 2), image_y + image_size + int(APP_HEIGHT * 0.048))
-        )
-        self.screen.blit(name_text, name_rect)
+        # Draw winner name below image
+        layer.blit(self.name_surface, self.name_rect)
+        # match the display format once instead of converting on every blit
+        return layer.convert_alpha()
 
-        # Draw buttons
-        self._draw_button(
-            self.new_game_button_rect,
-            "Start New Game",
-            hovered=self.new_game_hovered,
-            normal_color=(50, 150, 50),  # Green
-            hover_color=(70, 200, 70),  # Lighter green on hover
-        )
+    def _draw(self) -> None:
+        """Draw the winner display dialog."""
+        # Draw overlay, dialog, image and texts in one go
+        self.screen.blit(self.static_layer, (0, 0))
 
-        self._draw_button(
-            self.quit_button_rect,
-            "Quit",
-            hovered=self.quit_hovered,
-            normal_color=(150, 50, 50),  # Red
-            hover_color=(200, 70, 70),  # Lighter red on hover
-        )
+        # Draw buttons
+        for i, layers in enumerate(self.button_layers):
+            self._draw_button(layers, hovered=i == self.hovered_index)
 
-    def _draw_button(
+    def _build_button_layers(
         self,
-        rect: pygame.Rect,
-        text: str,
+        button_rect: pygame.Rect,
+        text_surface: pygame.Surface,
         *,
-        hovered: bool,
         normal_color: tuple[int, int, int],
         hover_color: tuple[int, int, int],
-    ) -> None:
-        """Draw a button with hover effect.
+    ) -> dict[bool, tuple[pygame.Surface, tuple[int, int]]]:
+        """Render a button with and without hover effect.
 
         Args:
-            rect: The button rectangle.
-            text: The button text.
-            hovered: Whether the button is hovered.
+            button_rect: The button rectangle.
+            text_surface: The rendered button text.
             normal_color: The normal button color.
             hover_color: The hover button color.
-        """
-        # Choose color based on hover state
-        color = hover_color if hovered else normal_color
 
-        # Draw button background - scale border radius
+        Returns:
+            (surface, position) of the rendered button keyed by whether
+            it is hovered.
+        """
+        text_rect = text_surface.get_rect(center=button_rect.center)
+        # the text can be wider than the button at small window sizes
+        bounds = button_rect.union(text_rect)
+        rect = button_rect.move(-bounds.x, -bounds.y)
+        text_rect.move_ip(-bounds.x, -bounds.y)
         border_radius = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
-        pygame.draw.rect(self.screen, color, rect, border_radius=border_radius)
-
-        # Draw button border
-        border_color = (255, 215, 0) if hovered else (200, 200, 100)
         border_width = max(2, int(APP_HEIGHT * 0.0036))  # 0.36% of screen height, min 2
-        pygame.draw.rect(
-            self.screen, border_color, rect, border_width, border_radius=border_radius
-        )
+        layers: dict[bool, tuple[pygame.Surface, tuple[int, int]]] = {}
+        for hovered in (False, True):
+            # transparent outside of the rounded corners
+            surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+
+            # Draw button background - choose color based on hover state
+            color = hover_color if hovered else normal_color
+            pygame.draw.rect(surface, color, rect, border_radius=border_radius)
+
+            # Draw button border
+            border_color = (255, 215, 0) if hovered else (200, 200, 100)
+            pygame.draw.rect(
+                surface, border_color, rect, border_width, border_radius=border_radius
+            )
 
-        # Draw button text - scale font size
-        button_font_size = int(APP_HEIGHT * 0.058)  # 5.8% of screen height
-        button_font = pygame.font.Font(None, button_font_size)
-        button_text = button_font.render(text, ANTI_ALIASING, (255, 255, 255))
-        text_rect = button_text.get_rect(center=rect.center)
-        self.screen.blit(button_text, text_rect)
+            # Draw button text
+            surface.blit(text_surface, text_rect)
+            layers[hovered] = (surface.convert_alpha(), bounds.topleft)
+        return layers
+
+    def _draw_button(
+        self,
+        layers: dict[bool, tuple[pygame.Surface, tuple[int, int]]],
+        *,
+        hovered: bool,
+    ) -> None:
+        """Draw a button with hover effect.
+
+        Args:
+            layers: (surface, position) of the rendered button keyed by whether
+                it is hovered.
+            hovered: Whether the button is hovered.
+        """
+        self.screen.blit(*layers[hovered])
@@ -21,10 +21,6 @@ def test_get_screen() -> None:
     """Test function."""
 
 
-def test_simulate_first_shuffle_and_deal() -> None:
-    """Test function."""
-
-
 def test_run_event_loop() -> None:
     """Test function."""
 
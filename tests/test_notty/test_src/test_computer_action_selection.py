@@ -25,6 +25,10 @@ def test_computer_chooses_action() -> None:
     """Test function."""
 
 
+def test_wait_for_autosave() -> None:
+    """Test function."""
+
+
 def test_save_qlearning_agent() -> None:
     """Test function."""
 
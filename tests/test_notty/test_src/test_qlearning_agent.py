@@ -22,6 +22,15 @@ class TestQLearningAgent:
     def test_save(self) -> None:
         """Test method."""
 
+    def test_save_in_background(self) -> None:
+        """Test method."""
+
+    def test_serialize(self) -> None:
+        """Test method."""
+
+    def test_write(self) -> None:
+        """Test method."""
+
     def test_load(self) -> None:
         """Test method."""
 
@@ -20,6 +20,12 @@ class TestActionButton:
     def test_update_hover(self) -> None:
         """Test method."""
 
+    def test__build_state_surface(self) -> None:
+        """Test method."""
+
+    def test_get_blit_pair(self) -> None:
+        """Test method."""
+
     def test_draw(self) -> None:
         """Test method."""
 
@@ -4,6 +4,15 @@
 class TestVisual:
     """Test class."""
 
+    def test_x(self) -> None:
+        """Test method."""
+
+    def test_y(self) -> None:
+        """Test method."""
+
+    def test_load_png(self) -> None:
+        """Test method."""
+
     def test_get_center(self) -> None:
         """Test method."""
 
@@ -16,6 +25,18 @@ class TestVisual:
     def test_set_position(self) -> None:
         """Test method."""
 
+    def test_is_moving(self) -> None:
+        """Test method."""
+
+    def test_animate(self) -> None:
+        """Test method."""
+
+    def test_get_visuals(self) -> None:
+        """Test method."""
+
+    def test_get_blit_pairs(self) -> None:
+        """Test method."""
+
     def test_draw(self) -> None:
         """Test method."""
 
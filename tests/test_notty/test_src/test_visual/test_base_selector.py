@@ -35,14 +35,38 @@ class TestBaseSelector:
     def test__get_dialog_dimensions(self) -> None:
         """Test method."""
 
+    def test__get_dialog_rect(self) -> None:
+        """Test method."""
+
     def test__get_selected_items(self) -> None:
         """Test method."""
 
+    def test__toggle_selection(self) -> None:
+        """Test method."""
+
     def test__is_valid_selection(self) -> None:
         """Test method."""
 
     def test_show(self) -> None:
         """Test method."""
 
+    def test__get_clicked_button(self) -> None:
+        """Test method."""
+
+    def test__get_button_index(self) -> None:
+        """Test method."""
+
+    def test__update_hover(self) -> None:
+        """Test method."""
+
+    def test__render_title(self) -> None:
+        """Test method."""
+
+    def test__build_chrome(self) -> None:
+        """Test method."""
+
     def test__draw(self) -> None:
         """Test method."""
+
+    def test__draw_buttons(self) -> None:
+        """Test method."""
@@ -21,6 +21,9 @@ class TestVisualCard:
     def test___init__(self) -> None:
         """Test method."""
 
+    def test_load_png(self) -> None:
+        """Test method."""
+
     def test_get_png_name(self) -> None:
         """Test method."""
 
@@ -7,6 +7,9 @@ class TestMultiCardButton:
     def test___init__(self) -> None:
         """Test method."""
 
+    def test__build_state_layer(self) -> None:
+        """Test method."""
+
     def test_is_clicked(self) -> None:
         """Test method."""
 
@@ -26,6 +29,9 @@ class TestSubmitButton:
     def test___init__(self) -> None:
         """Test method."""
 
+    def test__build_state_surface(self) -> None:
+        """Test method."""
+
     def test_is_clicked(self) -> None:
         """Test method."""
 
@@ -57,8 +63,17 @@ class TestCardsSelector:
     def test__update_submit_button_state(self) -> None:
         """Test method."""
 
+    def test__render_instruction(self) -> None:
+        """Test method."""
+
     def test_show(self) -> None:
         """Test method."""
 
+    def test__get_button_index(self) -> None:
+        """Test method."""
+
+    def test__update_hover(self) -> None:
+        """Test method."""
+
     def test__draw(self) -> None:
         """Test method."""
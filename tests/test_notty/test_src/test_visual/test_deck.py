@@ -4,10 +4,16 @@
 class TestVisualDeck:
     """Test class."""
 
-    def test_draw(self) -> None:
+    def test___init__(self) -> None:
         """Test method."""
 
-    def test___init__(self) -> None:
+    def test_get_visuals(self) -> None:
+        """Test method."""
+
+    def test_get_blit_pairs(self) -> None:
+        """Test method."""
+
+    def test_get_size_label(self) -> None:
         """Test method."""
 
     def test__initialize_deck(self) -> None:
@@ -13,9 +13,18 @@ class TestVisualGame:
     def test_draw(self) -> None:
         """Test method."""
 
+    def test_get_visuals(self) -> None:
+        """Test method."""
+
     def test_draw_current_player_border(self) -> None:
         """Test method."""
 
+    def test_get_hand_border(self) -> None:
+        """Test method."""
+
+    def test_mark_state_changed(self) -> None:
+        """Test method."""
+
     def test_get_png_name(self) -> None:
         """Test method."""
 
@@ -31,6 +40,9 @@ class TestVisualGame:
     def test_get_current_player(self) -> None:
         """Test method."""
 
+    def test_is_computer_turn(self) -> None:
+        """Test method."""
+
     def test_can_computer_act(self) -> None:
         """Test method."""
 
@@ -115,11 +127,17 @@ class TestVisualGame:
     def test_all_players_have_no_cards(self) -> None:
         """Test method."""
 
+    def test_is_animating(self) -> None:
+        """Test method."""
+
     def test_action_is_possible(self) -> None:
         """Test method."""
 
     def test_get_all_possible_actions(self) -> None:
         """Test method."""
 
+    def test_get_possible_actions(self) -> None:
+        """Test method."""
+
     def test_do_action(self) -> None:
         """Test method."""
@@ -7,7 +7,7 @@ class TestVisualHand:
     def test___init__(self) -> None:
         """Test method."""
 
-    def test_draw(self) -> None:
+    def test_get_visuals(self) -> None:
         """Test method."""
 
     def test_get_png_name(self) -> None:
@@ -50,7 +50,7 @@ class TestVisualPlayer:
     def test___init__(self) -> None:
         """Test method."""
 
-    def test_draw(self) -> None:
+    def test_get_visuals(self) -> None:
         """Test method."""
 
     def test_get_png_name(self) -> None:
@@ -7,6 +7,9 @@ class TestPlayerNameButton:
     def test___init__(self) -> None:
         """Test method."""
 
+    def test__build_idle_layer(self) -> None:
+        """Test method."""
+
     def test_draw(self) -> None:
         """Test method."""
 
@@ -26,8 +29,23 @@ class TestPlayerNameSelector:
     def test__setup_buttons(self) -> None:
         """Test method."""
 
+    def test__render_title(self) -> None:
+        """Test method."""
+
+    def test__build_chrome(self) -> None:
+        """Test method."""
+
     def test__draw(self) -> None:
         """Test method."""
 
     def test_show(self) -> None:
         """Test method."""
+
+    def test_show_single(self) -> None:
+        """Test method."""
+
+    def test_show_multi(self) -> None:
+        """Test method."""
+
+    def test__update_frame(self) -> None:
+        """Test method."""
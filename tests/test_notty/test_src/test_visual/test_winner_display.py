@@ -15,3 +15,12 @@ class TestWinnerDisplay:
 
     def test__draw(self) -> None:
         """Test method."""
+
+    def test__build_static_layer(self) -> None:
+        """Test method."""
+
+    def test__build_button_layers(self) -> None:
+        """Test method."""
+
+    def test__get_button_index(self) -> None:
+        """Test method."""